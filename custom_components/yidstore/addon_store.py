@@ -34,13 +34,15 @@ does not churn the Supervisor.
 from __future__ import annotations
 
 import hashlib
-import io
 import json
 import logging
+import shutil
 import zipfile
 import zlib
 from pathlib import Path
 
+from .installer import _COPY_BUFSIZE
+
 _LOGGER = logging.getLogger(__name__)
 
 # Fixed identity/timestamp keeps commit hashes reproducible: republishing the
@@ -164,7 +166,7 @@ def ensure_repository_json(root: Path, name: str = "YidStore Add-ons") -> None:
         }, indent=2))
 
 
-def add_addon_from_zip(root: Path, slug: str, zip_bytes: bytes) -> dict:
+def add_addon_from_zip(root: Path, slug: str, zip_path: Path) -> dict:
     """Extract a Gitea archive into the store under ``src/<slug>/``.
 
     Gitea zipballs wrap everything in a single top-level ``<repo>-<ref>/``
@@ -173,12 +175,11 @@ def add_addon_from_zip(root: Path, slug: str, zip_bytes: bytes) -> dict:
     """
     src_dir = root / "src" / slug
     if src_dir.exists():
-        import shutil
         shutil.rmtree(src_dir)
     src_dir.mkdir(parents=True, exist_ok=True)
 
     config_found = False
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+    with zipfile.ZipFile(zip_path) as zf:
         names = [n for n in zf.namelist() if not n.endswith("/")]
         # Detect and strip the common top-level wrapper folder.
         top = None
@@ -193,7 +194,8 @@ def add_addon_from_zip(root: Path, slug: str, zip_bytes: bytes) -> dict:
                 continue
             dest = src_dir / rel
             dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_bytes(zf.read(name))
+            with zf.open(name) as src, open(dest, "wb") as out:
+                shutil.copyfileobj(src, out, _COPY_BUFSIZE)
             base = rel.rsplit("/", 1)[-1].lower()
             if base in ("config.yaml", "config.yml", "config.json"):
                 config_found = True
@@ -154,7 +154,9 @@ class PackageUpdateButton(ButtonEntity):
         """When entity is added to hass."""
         await super().async_added_to_hass()
         self.async_on_remove(
-            self._coordinator.async_add_listener(self._handle_coordinator_update)
+            self._coordinator.async_add_package_listener(
+                self._package_id, self._handle_coordinator_update
+            )
         )
 
     @callback
@@ -198,7 +200,9 @@ class PackageCheckUpdateButton(ButtonEntity):
         """When entity is added to hass."""
         await super().async_added_to_hass()
         self.async_on_remove(
-            self._coordinator.async_add_listener(self._handle_coordinator_update)
+            self._coordinator.async_add_package_listener(
+                self._package_id, self._handle_coordinator_update
+            )
         )
 
     @callback
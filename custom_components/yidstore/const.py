@@ -21,6 +21,10 @@ LOVELACE_VENDOR_FOLDER = "onoff"
 # /config/www/audio/<owner>/<repo>/...
 AUDIO_VENDOR_FOLDER = "audio"
 
+# Inflate release zips with python-isal / zlib-ng when one is importable.
+# Set to False to force the stdlib zipfile path (e.g. when debugging).
+ZIP_FAST_INFLATE = True
+
 # Update check interval (2 hours)
 UPDATE_CHECK_INTERVAL = 7200  # seconds
 
@@ -1,11 +1,16 @@
 """Coordinator for OnOff Integration Store package tracking."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
@@ -17,6 +22,23 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Repo-list mutations accepted by async_enqueue_op: mutator method, store.
+_OP_MUTATORS: dict[str, tuple[str, str]] = {
+    "add_custom": ("_add_custom_repo", "custom"),
+    "remove_custom": ("_remove_custom_repo", "custom"),
+    "hide": ("_hide_repo", "hidden"),
+    "unhide": ("_unhide_repo", "hidden"),
+    "remove_package": ("_remove_package", "packages"),
+}
+
+# How long a lazily fetched release-notes body is served before re-fetching.
+_RELEASE_NOTES_TTL = 300  # seconds
+
+
+def _make_package_id(owner: str, repo_name: str) -> str:
+    """Build the tracking key used for a package."""
+    return f"{owner}_{repo_name}".lower().replace("-", "_")
+
 
 def _norm_version(value: str | None) -> str:
     """Normalize a version/tag for comparison ("v3.2.0" == "3.2.0")."""
@@ -55,12 +77,90 @@ class OnOffGiteaStoreCoordinator(DataUpdateCoordinator):
         self._hidden_store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.hidden_repos")
         self._add_entities_callback = None  # Will be set by sensor platform
         self._add_button_entities_callback = None  # Will be set by button platform
-        self._add_update_entities_callback = None  # Will be set by update platform
+        self._add_update_entities_callback: AddEntitiesCallback | None = None  # Will be set by update platform
         self._created_entities: set[str] = set()
         self.custom_repos: list[dict[str, str]] = []
         self.hidden_repos: list[dict[str, str]] = []
+        self._pending_ops: list[tuple[str, str, str, dict, asyncio.Future]] = []
+        self._ops_task: asyncio.Task | None = None
+        # Per-package listeners, so a change to one package only refreshes
+        # that package's entities instead of every entity of the store. All
+        # platforms subscribe here; nothing uses the coordinator-wide list.
+        self._package_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        # One shared device identifier set per package for all its entities.
+        self._device_identifiers: dict[str, frozenset[tuple[str, str]]] = {}
+        # DeviceInfo per (entity kind, package), reused across state writes
+        # and entity re-creation; rebuilt only when its inputs change.
+        self._device_infos: dict[tuple[str, str], tuple[tuple, DeviceInfo]] = {}
+        # Latest-release bodies fetched on demand, keyed by (owner, repo).
+        self._release_notes_cache: dict[tuple[str, str], tuple[float, str | None]] = {}
+        # Release-notes fetches in progress, shared by concurrent callers.
+        self._release_notes_inflight: dict[tuple[str, str], asyncio.Future] = {}
         # Don't override _listeners - parent class handles it
 
+    def device_identifiers(self, package_id: str) -> frozenset[tuple[str, str]]:
+        """Return the (interned) device registry identifiers of a package."""
+        identifiers = self._device_identifiers.get(package_id)
+        if identifiers is None:
+            identifiers = self._device_identifiers[package_id] = frozenset({(DOMAIN, package_id)})
+        return identifiers
+
+    def _cached_device_info(self, kind: str, package_id: str, key: tuple) -> DeviceInfo:
+        """Return a cached DeviceInfo for (name, manufacturer, model, sw_version)."""
+        cached = self._device_infos.get((kind, package_id))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        name, manufacturer, model, sw_version = key
+        device_info = DeviceInfo(
+            identifiers=self.device_identifiers(package_id),
+            name=name,
+            manufacturer=manufacturer,
+            model=model.title(),
+            sw_version=sw_version,
+        )
+        self._device_infos[(kind, package_id)] = (key, device_info)
+        return device_info
+
+    def update_device_info(self, package_id: str, package_data: dict[str, Any], name: str) -> DeviceInfo:
+        """Return the update entity's DeviceInfo, rebuilt only when it changed."""
+        return self._cached_device_info("update", package_id, (
+            name,
+            package_data.get("owner", "Unknown"),
+            package_data.get("package_type", "integration"),
+            package_data.get("installed_version"),
+        ))
+
+    def sensor_device_info(self, package_id: str, package_data: dict[str, Any]) -> DeviceInfo:
+        """Return the package sensors' DeviceInfo, rebuilt only when it changed."""
+        return self._cached_device_info("sensor", package_id, (
+            package_data.get("repo_name", "Unknown"),
+            "OnOff Integration Store",
+            package_data.get("package_type", "unknown"),
+            package_data.get("installed_version", "unknown"),
+        ))
+
+    @callback
+    def async_add_package_listener(self, package_id: str, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for changes to one package; return a function to stop."""
+        self._package_listeners.setdefault(package_id, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners = self._package_listeners.get(package_id)
+            if listeners and update_callback in listeners:
+                listeners.remove(update_callback)
+                if not listeners:
+                    del self._package_listeners[package_id]
+
+        return remove_listener
+
+    @callback
+    def async_update_package_listeners(self, package_ids: Iterable[str]) -> None:
+        """Notify the listeners of the given packages only."""
+        for package_id in package_ids:
+            for update_callback in list(self._package_listeners.get(package_id, ())):
+                update_callback()
+
     async def async_load_packages(self) -> None:
         """Load tracked packages from storage."""
         _LOGGER.info("Loading tracked packages...")
@@ -101,7 +201,7 @@ class OnOffGiteaStoreCoordinator(DataUpdateCoordinator):
         domain: str | None = None,
     ) -> str:
         """Add or update a tracked package."""
-        package_id = f"{owner}_{repo_name}".lower().replace("-", "_")
+        package_id = _make_package_id(owner, repo_name)
 
         is_new_package = package_id not in self.packages
 
@@ -139,9 +239,9 @@ class OnOffGiteaStoreCoordinator(DataUpdateCoordinator):
             _LOGGER.info("Creating sensors for new package: %s", package_id)
             await self._create_sensors_for_package(package_id, package_data)
         else:
-            # If updating existing package, notify sensors to refresh
-            _LOGGER.info("Notifying sensors to update for: %s", package_id)
-            self.async_update_listeners()
+            # If updating existing package, notify its entities to refresh
+            _LOGGER.info("Notifying entities to update for: %s", package_id)
+            self.async_update_package_listeners((package_id,))
 
             # Update device registry with new version
             from homeassistant.helpers import device_registry as dr
@@ -245,7 +345,9 @@ class OnOffGiteaStoreCoordinator(DataUpdateCoordinator):
 
         _LOGGER.info("Checking for updates for %d packages...", len(self.packages))
 
+        changed: list[str] = []
         for package_id, package_data in self.packages.items():
+            before = dict(package_data)
             try:
                 source = package_data.get("source", "gitea")
                 if source == "hacs":
@@ -324,12 +426,15 @@ class OnOffGiteaStoreCoordinator(DataUpdateCoordinator):
                     _LOGGER.warning("Error checking updates for %s: %s", package_id, e)
                 # Mark as checked even on error to avoid repeated errors
                 package_data["last_check"] = datetime.now().isoformat()
+            finally:
+                if package_data != before:
+                    changed.append(package_id)
 
         # Save updated data
         await self.async_save_packages()
 
-        # Notify sensors to update
-        self.async_update_listeners()
+        # Notify the changed packages' entities
+        self.async_update_package_listeners(changed)
 
         _LOGGER.info("✓ Update check complete")
 
@@ -339,57 +444,172 @@ class OnOffGiteaStoreCoordinator(DataUpdateCoordinator):
 
     def get_package_by_repo(self, owner: str, repo_name: str) -> dict[str, Any] | None:
         """Get package information by owner and repo name."""
-        package_id = f"{owner}_{repo_name}".lower().replace("-", "_")
-        return self.packages.get(package_id)
+        return self.packages.get(_make_package_id(owner, repo_name))
+
+    async def async_get_release_notes(self, owner: str, repo_name: str) -> str | None:
+        """Return the latest release body of a repo, cached for a while."""
+        key = (owner, repo_name)
+        cached = self._release_notes_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _RELEASE_NOTES_TTL:
+            return cached[1]
+
+        # Join an identical request that is already on its way. Shielded so
+        # a cancelled joiner doesn't cancel the fetch for everyone else; if
+        # the fetch itself was cancelled (its owner went away), retry.
+        while (inflight := self._release_notes_inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+
+        future = self._release_notes_inflight[key] = self.hass.loop.create_future()
+        try:
+            release = await self.client.get_latest_release(owner, repo_name)
+            notes = release.get("body") if release else None
+        except Exception as err:
+            future.set_exception(err)
+            future.exception()  # retrieved here even if nobody else waits
+            raise
+        else:
+            self._release_notes_cache[key] = (time.monotonic(), notes)
+            future.set_result(notes)
+            return notes
+        finally:
+            self._release_notes_inflight.pop(key, None)
+            # Cancelled: release the joiners instead of leaving them hanging.
+            if not future.done():
+                future.cancel()
+
+    def _add_custom_repo(self, owner: str, repo: str, source: str = "gitea", repo_type: str | None = None, repo_url: str | None = None) -> bool:
+        """Add a custom repo in memory; return True if the list changed."""
+        if any(r.get("owner") == owner and r.get("repo") == repo for r in self.custom_repos):
+            return False
+        entry = {"owner": owner, "repo": repo, "source": source}
+        if repo_type:
+            entry["type"] = repo_type
+        if repo_url:
+            entry["url"] = repo_url
+        self.custom_repos.append(entry)
+        _LOGGER.info("Added custom repo: %s/%s (source=%s)", owner, repo, source)
+        return True
 
     async def async_add_custom_repo(self, owner: str, repo: str, source: str = "gitea", repo_type: str | None = None, repo_url: str | None = None) -> None:
         """Add a custom repo to the visible list."""
-        if not any(r.get("owner") == owner and r.get("repo") == repo for r in self.custom_repos):
-            entry = {"owner": owner, "repo": repo, "source": source}
-            if repo_type:
-                entry["type"] = repo_type
-            if repo_url:
-                entry["url"] = repo_url
-            self.custom_repos.append(entry)
+        if self._add_custom_repo(owner, repo, source=source, repo_type=repo_type, repo_url=repo_url):
             await self._custom_store.async_save({"repos": self.custom_repos})
-            _LOGGER.info("Added custom repo: %s/%s (source=%s)", owner, repo, source)
 
     def is_custom_repo(self, owner: str, repo: str) -> bool:
         """Check if a repo is in the custom list."""
         return any(r.get("owner", "").lower() == owner.lower() and r.get("repo", "").lower() == repo.lower() for r in self.custom_repos)
 
+    def _remove_custom_repo(self, owner: str, repo: str) -> bool:
+        """Remove a custom repo in memory; always persisted by the caller."""
+        self.custom_repos = [r for r in self.custom_repos if not (r["owner"].lower() == owner.lower() and r["repo"].lower() == repo.lower())]
+        _LOGGER.info("Removed custom repo: %s/%s", owner, repo)
+        return True
+
     async def async_remove_custom_repo(self, owner: str, repo: str) -> None:
         """Remove a custom repo from the list."""
-        self.custom_repos = [r for r in self.custom_repos if not (r["owner"].lower() == owner.lower() and r["repo"].lower() == repo.lower())]
+        self._remove_custom_repo(owner, repo)
         await self._custom_store.async_save({"repos": self.custom_repos})
-        _LOGGER.info("Removed custom repo: %s/%s", owner, repo)
 
     def get_custom_repos(self) -> list[dict[str, str]]:
         """Get list of custom repos."""
         return self.custom_repos.copy()
 
+    def _hide_repo(self, owner: str, repo: str) -> bool:
+        """Hide a repo in memory; return True if the list changed."""
+        if any(r["owner"] == owner and r["repo"] == repo for r in self.hidden_repos):
+            return False
+        self.hidden_repos.append({"owner": owner, "repo": repo})
+        _LOGGER.info("Hid repo: %s/%s", owner, repo)
+        return True
+
     async def async_hide_repo(self, owner: str, repo: str) -> None:
         """Hide a repository from view."""
-        if not any(r["owner"] == owner and r["repo"] == repo for r in self.hidden_repos):
-            self.hidden_repos.append({"owner": owner, "repo": repo})
+        if self._hide_repo(owner, repo):
             await self._hidden_store.async_save({"repos": self.hidden_repos})
-            _LOGGER.info("Hid repo: %s/%s", owner, repo)
+
+    def _unhide_repo(self, owner: str, repo: str) -> bool:
+        """Unhide a repo in memory; always persisted by the caller."""
+        self.hidden_repos = [r for r in self.hidden_repos if not (r["owner"] == owner and r["repo"] == repo)]
+        _LOGGER.info("Unhid repo: %s/%s", owner, repo)
+        return True
 
     async def async_unhide_repo(self, owner: str, repo: str) -> None:
         """Unhide a repository."""
-        self.hidden_repos = [r for r in self.hidden_repos if not (r["owner"] == owner and r["repo"] == repo)]
+        self._unhide_repo(owner, repo)
         await self._hidden_store.async_save({"repos": self.hidden_repos})
-        _LOGGER.info("Unhid repo: %s/%s", owner, repo)
 
     def is_hidden_repo(self, owner: str, repo: str) -> bool:
         """Check if a repo is manually hidden."""
         return any(r["owner"].lower() == owner.lower() and r["repo"].lower() == repo.lower() for r in self.hidden_repos)
 
+    def _remove_package(self, owner: str, repo_name: str) -> bool:
+        """Drop a tracked package in memory; return True if it was tracked."""
+        package_id = _make_package_id(owner, repo_name)
+        if package_id not in self.packages:
+            return False
+        _LOGGER.info("Removing tracking for package: %s", package_id)
+        self.packages.pop(package_id)
+        return True
+
     async def async_remove_package(self, owner: str, repo_name: str) -> None:
         """Remove a tracked package from storage."""
-        package_id = f"{owner}_{repo_name}".lower().replace("-", "_")
-        if package_id in self.packages:
-            _LOGGER.info("Removing tracking for package: %s", package_id)
-            self.packages.pop(package_id)
+        if self._remove_package(owner, repo_name):
             await self.async_save_packages()
-            self.async_update_listeners()
+            self.async_update_package_listeners((_make_package_id(owner, repo_name),))
+
+    async def async_enqueue_op(self, op: str, owner: str, repo: str, **kwargs) -> None:
+        """Queue a repo-list mutation and wait until its batch is committed.
+
+        An op on an idle queue is applied straight away; rapid UI actions
+        (e.g. hiding several repos in a row) that arrive while a batch is
+        being committed land in the next batch, so each store is written
+        once per batch instead of once per request.
+        """
+        if op not in _OP_MUTATORS:
+            raise ValueError(f"Unknown repo operation: {op}")
+        fut = self.hass.loop.create_future()
+        self._pending_ops.append((op, owner, repo, kwargs, fut))
+        if self._ops_task is None or self._ops_task.done():
+            self._ops_task = self.hass.async_create_task(self._async_drain_ops())
+        await fut
+
+    async def _async_drain_ops(self) -> None:
+        """Apply queued mutations in batches until the queue is empty."""
+        while self._pending_ops:
+            batch, self._pending_ops = self._pending_ops, []
+            try:
+                await self.async_apply_ops([(op, o, r, kw) for op, o, r, kw, _fut in batch])
+            except Exception as err:
+                for *_, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(err)
+            else:
+                for *_, fut in batch:
+                    if not fut.done():
+                        fut.set_result(None)
+
+    async def async_apply_ops(self, ops: list[tuple[str, str, str, dict]]) -> None:
+        """Apply a batch of mutations, then persist each touched store once."""
+        dirty: set[str] = set()
+        removed: list[str] = []
+        try:
+            for op, owner, repo, kwargs in ops:
+                mutator, store = _OP_MUTATORS[op]
+                if getattr(self, mutator)(owner, repo, **kwargs):
+                    dirty.add(store)
+                    if store == "packages":
+                        removed.append(_make_package_id(owner, repo))
+        finally:
+            # Persist what was already changed in memory even if a later op
+            # failed, so memory and storage don't drift apart.
+            if "custom" in dirty:
+                await self._custom_store.async_save({"repos": self.custom_repos})
+            if "hidden" in dirty:
+                await self._hidden_store.async_save({"repos": self.hidden_repos})
+            if "packages" in dirty:
+                await self.async_save_packages()
+                self.async_update_package_listeners(removed)
@@ -6,6 +6,7 @@ import os
 import re
 import secrets
 import shutil
+import tempfile
 import time
 import uuid
 import asyncio
@@ -20,30 +21,36 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.storage import Store
 from homeassistant.components import frontend
+from homeassistant.util.json import json_loads
 
 from .const import DOMAIN, CONF_SIDE_PANEL, SERVICE_INSTALL
 from .config_flow import load_store_list
 from .installer import uninstall_package
 
 
+# Single-pass GitHub repo URL match: optional scheme/www, trailing ".git",
+# slash, extra path (tree/main/...), query or fragment are all tolerated.
+_GITHUB_URL_RE = re.compile(
+    r"^(?:https?://)?(?:www\.)?github\.com/([^/\s?#]+)/([^/\s?#]+?)(?:\.git)?(?:[/?#].*)?$",
+    re.IGNORECASE,
+)
+
+
 def _parse_github_url(url: str) -> tuple[str, str] | None:
-    try:
-        cleaned = url.strip()
-        if cleaned.endswith(".git"):
-            cleaned = cleaned[:-4]
-        cleaned = cleaned.replace("https://", "").replace("http://", "")
-        parts = cleaned.split("/")
-        if len(parts) < 3:
-            return None
-        if parts[0].lower() != "github.com":
-            return None
-        owner = parts[1].strip()
-        repo = parts[2].strip()
-        if not owner or not repo:
-            return None
-        return owner, repo
-    except Exception:
+    m = _GITHUB_URL_RE.match((url or "").strip())
+    return (m.group(1), m.group(2)) if m else None
+
+
+async def _read_json_body(request: web.Request) -> dict | None:
+    """Parse the request's JSON body, or return None when it has none.
+
+    Empty POSTs are detected from the headers, so they are rejected
+    without a read or a parse; non-empty bodies are parsed straight from
+    bytes.
+    """
+    if not request.body_exists or request.content_length == 0:
         return None
+    return json_loads(await request.read())
 
 
 async def _github_json(hass: HomeAssistant, url: str) -> dict | list | None:
@@ -715,16 +722,10 @@ async def async_setup_dashboard(hass: HomeAssistant, entry) -> None:
     hass.http.register_view(OnOffStoreReadmeView(eid))
     hass.http.register_view(OnOffStoreReleasesView(eid))
     hass.http.register_view(OnOffStoreRefreshView(eid))
-    hass.http.register_view(OnOffStoreAddCustomView(eid))
-    hass.http.register_view(OnOffStoreListCustomView(eid))
-    hass.http.register_view(OnOffStoreRemoveCustomView(eid))
-    hass.http.register_view(OnOffStoreHideView(eid))
-    hass.http.register_view(OnOffStoreUnhideView(eid))
-    hass.http.register_view(OnOffStoreUninstallView(eid))
+    hass.http.register_view(OnOffStoreAPIView(eid))
     hass.http.register_view(OnOffStoreStatusView(eid))
-    hass.http.register_view(LocalBrandsIconView())
-    hass.http.register_view(LocalBrandsListView())
-    hass.http.register_view(LocalBrandsUploadView())
+    hass.http.register_view(LocalBrandsIconView(hass))
+    hass.http.register_view(LocalBrandsUploadView(hass))
     hass.http.register_view(DocumentationReposView(eid))
     hass.http.register_view(DocumentationFilesView(eid))
     hass.http.register_view(DocumentationContentView(eid))
@@ -1549,7 +1550,9 @@ class OnOffStoreInstallView(HomeAssistantView):
                 if not eids: return web.json_response({"error": "Integration not ready"}, status=503)
                 eid = eids[0]
 
-            body = await request.json()
+            body = await _read_json_body(request)
+            if body is None:
+                return web.json_response({"error": "Empty body"}, status=400)
             o, r, t = body.get("owner"), body.get("repo"), body.get("type", "integration")
             source = body.get("source")
             repo_url = body.get("repo_url")
@@ -1785,7 +1788,7 @@ class OnOffStoreRefreshView(HomeAssistantView):
             # (used by the "Full Reload" menu action).
             rebuild = False
             try:
-                body = await request.json()
+                body = await _read_json_body(request) or {}
                 rebuild = bool(body.get("rebuild"))
             except Exception:
                 pass
@@ -1808,227 +1811,223 @@ class OnOffStoreRefreshView(HomeAssistantView):
             return web.json_response({"error": str(e)}, status=500)
 
 
-class OnOffStoreAddCustomView(HomeAssistantView):
-    """API to add a custom repository."""
-    url = "/api/yidstore/custom/add"
-    name = "api:yidstore:custom:add"
-    requires_auth = False
-
-    def __init__(self, entry_id: str) -> None:
-        self.entry_id = entry_id
-
-    async def post(self, request: web.Request) -> web.Response:
-        hass = request.app["hass"]
-        try:
-            body = await request.json()
-            source = body.get("source", "gitea")
-            repo_type = body.get("type") or ("audio" if str(body.get("owner", "")).strip().lower() == "audio" else "integration")
-            repo_url = body.get("url")
-            o, r = body.get("owner"), body.get("repo")
-
-            if source == "github":
-                if not repo_url:
-                    return web.json_response({"error": "Missing GitHub URL"}, status=400)
-                parsed = _parse_github_url(repo_url)
-                if not parsed:
-                    return web.json_response({"error": "Invalid GitHub URL"}, status=400)
-                o, r = parsed
-                if not body.get("type") and o.lower() == "audio":
-                    repo_type = "audio"
-            elif not o or not r:
-                return web.json_response({"error": "Missing params"}, status=400)
-            
-            eid = self.entry_id
-            if DOMAIN not in hass.data: return web.json_response({"error": "Not ready"}, status=503)
-            if eid not in hass.data[DOMAIN]:
-                eids = list(hass.data[DOMAIN].keys())
-                if eids: eid = eids[0]
-                else: return web.json_response({"error": "Not ready"}, status=503)
-
-            coordinator = hass.data[DOMAIN][eid].get("coordinator")
-            if coordinator:
-                await coordinator.async_add_custom_repo(o, r, source=source, repo_type=repo_type, repo_url=repo_url)
-                # New repo needs a real collection pass; start it right away
-                # so the frontend's follow-up reload picks it up.
-                _invalidate_repos_cache()
-                _ensure_repos_rebuild(hass, eid)
-                return web.json_response({"success": True})
-            return web.json_response({"error": "Coordinator missing"}, status=503)
-        except Exception as e:
-            return web.json_response({"error": str(e)}, status=500)
-
-
-class OnOffStoreListCustomView(HomeAssistantView):
-    """API to list custom repositories."""
-    url = "/api/yidstore/custom/list"
-    name = "api:yidstore:custom:list"
-    requires_auth = False
-
-    def __init__(self, entry_id: str) -> None:
-        self.entry_id = entry_id
-
-    async def get(self, request: web.Request) -> web.Response:
-        hass = request.app["hass"]
-        try:
-            eid = self.entry_id
-            if DOMAIN not in hass.data: return web.json_response({"error": "Not ready"}, status=503)
-            if eid not in hass.data[DOMAIN]:
-                eids = list(hass.data[DOMAIN].keys())
-                if eids: eid = eids[0]
-                else: return web.json_response({"error": "Not ready"}, status=503)
-
-            coordinator = hass.data[DOMAIN][eid].get("coordinator")
-            if coordinator:
-                return web.json_response(coordinator.get_custom_repos())
-            return web.json_response({"error": "Coordinator missing"}, status=503)
-        except Exception as e:
-            return web.json_response({"error": str(e)}, status=500)
-
-
-class OnOffStoreRemoveCustomView(HomeAssistantView):
-    """API to remove a custom repository."""
-    url = "/api/yidstore/custom/remove"
-    name = "api:yidstore:custom:remove"
-    requires_auth = False
+async def _api_add_custom(hass: HomeAssistant, coordinator, body: dict) -> web.Response:
+    """Add a custom repository."""
+    source = body.get("source", "gitea")
+    repo_type = body.get("type") or ("audio" if str(body.get("owner", "")).strip().lower() == "audio" else "integration")
+    repo_url = body.get("url")
+    o, r = body.get("owner"), body.get("repo")
+
+    if source == "github":
+        if not repo_url:
+            return web.json_response({"error": "Missing GitHub URL"}, status=400)
+        parsed = _parse_github_url(repo_url)
+        if not parsed:
+            return web.json_response({"error": "Invalid GitHub URL"}, status=400)
+        o, r = parsed
+        if not body.get("type") and o.lower() == "audio":
+            repo_type = "audio"
+    elif not o or not r:
+        return web.json_response({"error": "Missing params"}, status=400)
+
+    await coordinator.async_enqueue_op("add_custom", o, r, source=source, repo_type=repo_type, repo_url=repo_url)
+    # New repo needs a real collection pass; start it right away
+    # so the frontend's follow-up reload picks it up.
+    _invalidate_repos_cache()
+    _ensure_repos_rebuild(hass, coordinator.entry_id)
+    return web.json_response({"success": True})
+
+
+async def _api_list_custom(hass: HomeAssistant, coordinator, body: dict) -> web.Response:
+    """List custom repositories."""
+    return web.json_response(coordinator.get_custom_repos())
+
+
+async def _api_remove_custom(hass: HomeAssistant, coordinator, body: dict) -> web.Response:
+    """Remove a custom repository."""
+    o, r = body.get("owner"), body.get("repo")
+    if not o or not r:
+        return web.json_response({"error": "Missing params"}, status=400)
+
+    await coordinator.async_enqueue_op("remove_custom", o, r)
+    _invalidate_repos_cache()
+    _ensure_repos_rebuild(hass, coordinator.entry_id)
+    return web.json_response({"success": True})
+
+
+async def _api_hide(hass: HomeAssistant, coordinator, body: dict) -> web.Response:
+    """Hide a repository."""
+    o, r = body.get("owner"), body.get("repo")
+    await coordinator.async_enqueue_op("hide", o, r)
+    _patch_repos_cache(o, r, is_hidden=True)
+    return web.json_response({"success": True})
+
+
+async def _api_unhide(hass: HomeAssistant, coordinator, body: dict) -> web.Response:
+    """Unhide a repository."""
+    o, r = body.get("owner"), body.get("repo")
+    await coordinator.async_enqueue_op("unhide", o, r)
+    _patch_repos_cache(o, r, is_hidden=False)
+    return web.json_response({"success": True})
+
+
+async def _api_uninstall(hass: HomeAssistant, coordinator, body: dict) -> web.Response:
+    """Uninstall a repository."""
+    o, r, t = body.get("owner"), body.get("repo"), body.get("type", "integration")
+    if not o or not r:
+        return web.json_response({"error": "Missing params"}, status=400)
+
+    tracked_pkg = coordinator.get_package_by_repo(o, r) or {}
+    domain = tracked_pkg.get("domain")
+    # 1. Delete folder
+    await hass.async_add_executor_job(uninstall_package, hass, t, r, o, domain)
+    # 2. Remove tracking
+    await coordinator.async_enqueue_op("remove_package", o, r)
+
+    # Remove from requires_restart if present
+    if "yidstore_requires_restart" in hass.data:
+        hass.data["yidstore_requires_restart"].discard(f"{o}/{r}".lower())
+
+    _patch_repos_cache(
+        o, r,
+        is_installed=False,
+        install_source=None,
+        update_available=False,
+    )
+    _invalidate_local_state_cache()
+    return web.json_response({"success": True})
 
-    def __init__(self, entry_id: str) -> None:
-        self.entry_id = entry_id
 
-    async def post(self, request: web.Request) -> web.Response:
-        hass = request.app["hass"]
-        try:
-            body = await request.json()
-            o, r = body.get("owner"), body.get("repo")
-            if not o or not r:
-                return web.json_response({"error": "Missing params"}, status=400)
+_BRAND_FILENAMES = [
+    "icon.png", "icon@2x.png", "dark_icon.png", "dark_icon@2x.png",
+    "logo.png", "logo@2x.png", "dark_logo.png", "dark_logo@2x.png",
+    "icon.svg", "logo.svg",
+]
+_BRAND_ROOTS_KEY = f"{DOMAIN}_brand_roots"
 
-            eid = self.entry_id
-            if DOMAIN not in hass.data: return web.json_response({"error": "Not ready"}, status=503)
-            if eid not in hass.data[DOMAIN]:
-                eids = list(hass.data[DOMAIN].keys())
-                if eids: eid = eids[0]
-                else: return web.json_response({"error": "Not ready"}, status=503)
 
-            coordinator = hass.data[DOMAIN][eid].get("coordinator")
-            if coordinator:
-                await coordinator.async_remove_custom_repo(o, r)
-                _invalidate_repos_cache()
-                _ensure_repos_rebuild(hass, eid)
-                return web.json_response({"success": True})
-            return web.json_response({"error": "Coordinator missing"}, status=503)
-        except Exception as e:
-            return web.json_response({"error": str(e)}, status=500)
+def _brand_roots(hass: HomeAssistant) -> tuple[Path, Path]:
+    """Return the custom_components and legacy www/brands folders.
 
+    Resolved once and kept in hass.data; the brand list handler and the
+    brand icon views all look icons up under these two roots.
+    """
+    roots = hass.data.get(_BRAND_ROOTS_KEY)
+    if roots is None:
+        roots = hass.data[_BRAND_ROOTS_KEY] = (
+            Path(hass.config.path("custom_components")),
+            Path(hass.config.path("www", "brands")),
+        )
+    return roots
 
-class OnOffStoreHideView(HomeAssistantView):
-    """API to hide a repository."""
-    url = "/api/yidstore/hide"
-    name = "api:yidstore:hide"
-    requires_auth = False
 
-    def __init__(self, entry_id: str) -> None:
-        self.entry_id = entry_id
+async def _api_list_brands(hass: HomeAssistant, coordinator, body: dict) -> web.Response:
+    """Return list of domains with local icons."""
+    cc_root, brands_root = _brand_roots(hass)
 
-    async def post(self, request: web.Request) -> web.Response:
-        hass = request.app["hass"]
-        try:
-            body = await request.json()
-            o, r = body.get("owner"), body.get("repo")
-            eid = self.entry_id
-            if DOMAIN not in hass.data: return web.json_response({"error": "Not ready"}, status=503)
-            if eid not in hass.data[DOMAIN]:
-                eids = list(hass.data[DOMAIN].keys())
-                if eids: eid = eids[0]
-                else: return web.json_response({"error": "Not ready"}, status=503)
+    def _scan_brand_dirs() -> dict[str, dict[str, str]]:
+        """Scan brand directories in executor to avoid blocking event loop."""
+        domains_with_icons: dict[str, dict[str, str]] = {}
 
-            coordinator = hass.data[DOMAIN][eid].get("coordinator")
-            if coordinator:
-                await coordinator.async_hide_repo(o, r)
-                _patch_repos_cache(o, r, is_hidden=True)
-                return web.json_response({"success": True})
-            return web.json_response({"error": "Coordinator missing"}, status=503)
-        except Exception as e:
-            return web.json_response({"error": str(e)}, status=500)
+        def _add(domain: str, filename: str) -> None:
+            domains_with_icons.setdefault(domain, {})[filename] = f"/api/yidstore/brands/{domain}/{filename}"
 
+        def _file_names(path: str) -> set[str]:
+            # One scandir per folder; DirEntry carries the file type so no
+            # per-candidate exists()/stat probing is needed.
+            try:
+                with os.scandir(path) as it:
+                    return {e.name for e in it if e.is_file()}
+            except OSError:
+                return set()
 
-class OnOffStoreUnhideView(HomeAssistantView):
-    """API to unhide a repository."""
-    url = "/api/yidstore/unhide"
-    name = "api:yidstore:unhide"
+        def _domain_dirs(root: Path) -> list[os.DirEntry]:
+            try:
+                with os.scandir(root) as it:
+                    return [e for e in it if e.is_dir()]
+            except OSError:
+                return []
+
+        # Check custom_components folders
+        for d in _domain_dirs(cc_root):
+            # Prefer <domain>/brand/<file>, then fallback to <domain>/<file>.
+            names = _file_names(os.path.join(d.path, "brand")) | _file_names(d.path)
+            for fn in _BRAND_FILENAMES:
+                if fn in names:
+                    _add(d.name, fn)
+
+        # Legacy fallback (read-only): check www/brands.
+        for d in _domain_dirs(brands_root):
+            names = _file_names(d.path)
+            existing = domains_with_icons.get(d.name, {})
+            for fn in _BRAND_FILENAMES:
+                if fn in names and fn not in existing:
+                    _add(d.name, fn)
+
+        return domains_with_icons
+
+    domains_with_icons = await hass.async_add_executor_job(_scan_brand_dirs)
+    return web.json_response(domains_with_icons)
+
+
+# (method, action) -> (handler, needs_coordinator)
+_API_HANDLERS = {
+    ("POST", "custom/add"): (_api_add_custom, True),
+    ("GET", "custom/list"): (_api_list_custom, True),
+    ("POST", "custom/remove"): (_api_remove_custom, True),
+    ("POST", "hide"): (_api_hide, True),
+    ("POST", "unhide"): (_api_unhide, True),
+    ("POST", "uninstall"): (_api_uninstall, True),
+    ("GET", "brands"): (_api_list_brands, False),
+}
+
+
+class OnOffStoreAPIView(HomeAssistantView):
+    """Single route for the small repo-list and brand-list endpoints.
+
+    The action segment is restricted to the known handlers so this view
+    never shadows the other /api/yidstore/... routes.
+    """
+    url = "/api/yidstore/{action:custom/add|custom/list|custom/remove|hide|unhide|uninstall|brands}"
+    name = "api:yidstore:actions"
     requires_auth = False
 
     def __init__(self, entry_id: str) -> None:
         self.entry_id = entry_id
 
-    async def post(self, request: web.Request) -> web.Response:
-        hass = request.app["hass"]
-        try:
-            body = await request.json()
-            o, r = body.get("owner"), body.get("repo")
-            
-            eid = self.entry_id
-            if DOMAIN not in hass.data: return web.json_response({"error": "Not ready"}, status=503)
-            if eid not in hass.data[DOMAIN]:
-                eids = list(hass.data[DOMAIN].keys())
-                if eids: eid = eids[0]
-                else: return web.json_response({"error": "Not ready"}, status=503)
+    async def get(self, request: web.Request, action: str) -> web.Response:
+        return await self._dispatch(request, action)
 
-            coordinator = hass.data[DOMAIN][eid].get("coordinator")
-            if coordinator:
-                await coordinator.async_unhide_repo(o, r)
-                _patch_repos_cache(o, r, is_hidden=False)
-                return web.json_response({"success": True})
-            return web.json_response({"error": "Coordinator missing"}, status=503)
-        except Exception as e:
-            return web.json_response({"error": str(e)}, status=500)
-
-
-class OnOffStoreUninstallView(HomeAssistantView):
-    """API to uninstall a repository."""
-    url = "/api/yidstore/uninstall"
-    name = "api:yidstore:uninstall"
-    requires_auth = False
-
-    def __init__(self, entry_id: str) -> None:
-        self.entry_id = entry_id
+    async def post(self, request: web.Request, action: str) -> web.Response:
+        return await self._dispatch(request, action)
 
-    async def post(self, request: web.Request) -> web.Response:
+    async def _dispatch(self, request: web.Request, action: str) -> web.Response:
         hass = request.app["hass"]
+        handler = _API_HANDLERS.get((request.method, action))
+        if handler is None:
+            return web.json_response({"error": "Method not allowed"}, status=405)
+        func, needs_coordinator = handler
         try:
-            body = await request.json()
-            o, r, t = body.get("owner"), body.get("repo"), body.get("type", "integration")
-            if not o or not r:
-                return web.json_response({"error": "Missing params"}, status=400)
-
-            eid = self.entry_id
-            if DOMAIN not in hass.data: return web.json_response({"error": "Not ready"}, status=503)
-            if eid not in hass.data[DOMAIN]:
-                eids = list(hass.data[DOMAIN].keys())
-                if eids: eid = eids[0]
-                else: return web.json_response({"error": "Not ready"}, status=503)
-
-            coordinator = hass.data[DOMAIN][eid].get("coordinator")
-            if coordinator:
-                tracked_pkg = coordinator.get_package_by_repo(o, r) or {}
-                domain = tracked_pkg.get("domain")
-                # 1. Delete folder
-                await hass.async_add_executor_job(uninstall_package, hass, t, r, o, domain)
-                # 2. Remove tracking
-                await coordinator.async_remove_package(o, r)
-
-                # Remove from requires_restart if present
-                if "yidstore_requires_restart" in hass.data:
-                    hass.data["yidstore_requires_restart"].discard(f"{o}/{r}".lower())
-
-                _patch_repos_cache(
-                    o, r,
-                    is_installed=False,
-                    install_source=None,
-                    update_available=False,
-                )
-                _invalidate_local_state_cache()
-                return web.json_response({"success": True})
-            return web.json_response({"error": "Coordinator missing"}, status=503)
+            body = {}
+            if request.method == "POST":
+                body = await _read_json_body(request)
+                if body is None:
+                    return web.json_response({"error": "Empty body"}, status=400)
+
+            coordinator = None
+            if needs_coordinator:
+                eid = self.entry_id
+                if DOMAIN not in hass.data: return web.json_response({"error": "Not ready"}, status=503)
+                if eid not in hass.data[DOMAIN]:
+                    eids = list(hass.data[DOMAIN].keys())
+                    if eids: eid = eids[0]
+                    else: return web.json_response({"error": "Not ready"}, status=503)
+
+                coordinator = hass.data[DOMAIN][eid].get("coordinator")
+                if not coordinator:
+                    return web.json_response({"error": "Coordinator missing"}, status=503)
+
+            return await func(hass, coordinator, body)
         except Exception as e:
             return web.json_response({"error": str(e)}, status=500)
 
@@ -2133,6 +2132,9 @@ class LocalBrandsIconView(HomeAssistantView):
     name = "api:yidstore:brands"
     requires_auth = False
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._cc_root, self._brands_root = _brand_roots(hass)
+
     async def get(self, request: web.Request, domain: str, filename: str) -> web.Response:
         """Serve icon file from local brands or custom_components folder."""
         hass = request.app["hass"]
@@ -2151,13 +2153,13 @@ class LocalBrandsIconView(HomeAssistantView):
 
         # Try multiple locations in order of preference
         locations = [
-            os.path.join(hass.config.path("custom_components", domain, "brand"), filename),
-            os.path.join(hass.config.path("custom_components", domain), filename),
+            self._cc_root / domain / "brand" / filename,
+            self._cc_root / domain / filename,
             # Legacy fallback (read-only) for older installs.
-            os.path.join(hass.config.path("www", "brands", domain), filename),
+            self._brands_root / domain / filename,
         ]
 
-        def _read_file(file_path: str) -> bytes | None:
+        def _read_file(file_path: Path) -> bytes | None:
             """Read file in executor."""
             if os.path.exists(file_path) and os.path.isfile(file_path):
                 with open(file_path, 'rb') as f:
@@ -2221,70 +2223,15 @@ class LocalBrandsIconView(HomeAssistantView):
         return web.Response(status=404, headers={"Cache-Control": "public, max-age=3600"})
 
 
-class LocalBrandsListView(HomeAssistantView):
-    """List all available local brand icons."""
-    url = "/api/yidstore/brands"
-    name = "api:yidstore:brands_list"
-    requires_auth = False
-
-    async def get(self, request: web.Request) -> web.Response:
-        """Return list of domains with local icons."""
-        hass = request.app["hass"]
-
-        filenames = [
-            "icon.png", "icon@2x.png", "dark_icon.png", "dark_icon@2x.png",
-            "logo.png", "logo@2x.png", "dark_logo.png", "dark_logo@2x.png",
-            "icon.svg", "logo.svg",
-        ]
-
-        def _scan_brand_dirs() -> dict[str, dict[str, str]]:
-            """Scan brand directories in executor to avoid blocking event loop."""
-            domains_with_icons: dict[str, dict[str, str]] = {}
-
-            def _add(domain: str, filename: str) -> None:
-                domains_with_icons.setdefault(domain, {})[filename] = f"/api/yidstore/brands/{domain}/{filename}"
-
-            # Check custom_components folders
-            cc_path = hass.config.path("custom_components")
-            if os.path.exists(cc_path):
-                for domain in os.listdir(cc_path):
-                    domain_path = os.path.join(cc_path, domain)
-                    if not os.path.isdir(domain_path):
-                        continue
-                    for fn in filenames:
-                        # Prefer <domain>/brand/<file>, then fallback to <domain>/<file>.
-                        if os.path.exists(os.path.join(domain_path, "brand", fn)):
-                            _add(domain, fn)
-                            continue
-                        if os.path.exists(os.path.join(domain_path, fn)):
-                            _add(domain, fn)
-
-            # Legacy fallback (read-only): check www/brands.
-            brands_path = hass.config.path("www", "brands")
-            if os.path.exists(brands_path):
-                for domain in os.listdir(brands_path):
-                    domain_path = os.path.join(brands_path, domain)
-                    if not os.path.isdir(domain_path):
-                        continue
-                    for fn in filenames:
-                        if fn in domains_with_icons.get(domain, {}):
-                            continue
-                        if os.path.exists(os.path.join(domain_path, fn)):
-                            _add(domain, fn)
-
-            return domains_with_icons
-
-        domains_with_icons = await hass.async_add_executor_job(_scan_brand_dirs)
-        return web.json_response(domains_with_icons)
-
-
-
 class LocalBrandsUploadView(HomeAssistantView):
     """Upload local brand icons for custom integrations."""
     url = "/api/yidstore/brands/upload"
     name = "api:yidstore:brands_upload"
     requires_auth = False
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._cc_root = _brand_roots(hass)[0]
+
     async def post(self, request: web.Request) -> web.Response:
         hass = request.app["hass"]
 
@@ -2336,7 +2283,7 @@ class LocalBrandsUploadView(HomeAssistantView):
         if not files:
             return web.json_response({"error": "No files uploaded."}, status=400)
 
-        brands_dir = Path(hass.config.path("custom_components", domain, "brand"))
+        brands_dir = self._cc_root / domain / "brand"
 
         def _save_brand_files():
             """Save brand files in executor to avoid blocking event loop."""
@@ -2929,7 +2876,9 @@ class AddAutomationView(HomeAssistantView):
     async def post(self, request: web.Request) -> web.Response:
         hass = request.app["hass"]
         try:
-            data = await request.json()
+            data = await _read_json_body(request)
+            if data is None:
+                return web.json_response({"error": "Empty body"}, status=400)
             yaml_content = data.get("yaml", "")
             name = data.get("name", "New Automation")
 
@@ -3002,7 +2951,9 @@ class AddDashboardView(HomeAssistantView):
     async def post(self, request: web.Request) -> web.Response:
         hass = request.app["hass"]
         try:
-            data = await request.json()
+            data = await _read_json_body(request)
+            if data is None:
+                return web.json_response({"error": "Empty body"}, status=400)
             yaml_content = data.get("yaml", "")
             name = data.get("name", "New Dashboard")
             slug = data.get("slug", "custom-dashboard")
@@ -3260,7 +3211,9 @@ class AddHelperView(HomeAssistantView):
     async def post(self, request: web.Request) -> web.Response:
         hass = request.app["hass"]
         try:
-            data = await request.json()
+            data = await _read_json_body(request)
+            if data is None:
+                return web.json_response({"error": "Empty body"}, status=400)
             yaml_content = data.get("yaml", "")
             helper_type = data.get("type", "")  # input_boolean, input_number, input_text, etc.
             name = data.get("name", "New Helper")
@@ -4164,7 +4117,9 @@ class AppsInstallView(HomeAssistantView):
 
     async def post(self, request: web.Request) -> web.Response:
         hass = request.app["hass"]
-        data = await request.json()
+        data = await _read_json_body(request)
+        if data is None:
+            return web.json_response({"error": "Empty body"}, status=400)
         try:
             owner = data.get("owner", APPS_ORG)
             repo = data.get("repo", "").strip()
@@ -4225,62 +4180,70 @@ class AppsInstallView(HomeAssistantView):
                 headers["Authorization"] = f"token {client.token}"
 
             from . import addon_store
-            from .installer import _download_zip_bytes
+            from .installer import _download_zip_file
 
-            zip_bytes = await _download_zip_bytes(hass, url, headers=headers)
             slug = _addon_slug(repo)
-
-            # --- Option B: publish to YidStore's own local store, then let
-            # Supervisor clone + install it. Works on HA OS where Core cannot
-            # write to the Supervisor's local add-ons folder, and never
-            # exposes the upstream Gitea URL.
-            root = _addon_store_root(hass)
-
-            def _build_store():
-                addon_store.ensure_repository_json(root)
-                meta = addon_store.add_addon_from_zip(root, slug, zip_bytes)
-                addon_store.publish_from_dir(root)
-                return meta
-
-            meta = await hass.async_add_executor_job(_build_store)
-            commit = await hass.async_add_executor_job(addon_store.publish_from_dir, root)
-
-            reg = await _ensure_store_registered(hass)
-            registered = reg.get("registered")
-            register_error = reg.get("error")
-            await _supervisor_api(hass, "post", "/store/reload")
-
-            store_slug = await _supervisor_store_slug(hass, slug)
-            install_error = None
-            if store_slug:
-                install_resp = await _supervisor_api(
-                    hass, "post", f"/store/addons/{store_slug}/install"
-                )
-                if not (install_resp and install_resp[0] in (200, 201)):
-                    # Older Supervisor uses /addons/<slug>/install.
+            # The archive is streamed to a temp file rather than held in RAM.
+            download_dir = Path(
+                await hass.async_add_executor_job(tempfile.mkdtemp, None, "yidstore_dl_")
+            )
+            zip_path = download_dir / "archive.zip"
+            try:
+                await _download_zip_file(hass, url, headers, zip_path)
+
+                # --- Option B: publish to YidStore's own local store, then let
+                # Supervisor clone + install it. Works on HA OS where Core cannot
+                # write to the Supervisor's local add-ons folder, and never
+                # exposes the upstream Gitea URL.
+                root = _addon_store_root(hass)
+
+                def _build_store():
+                    addon_store.ensure_repository_json(root)
+                    meta = addon_store.add_addon_from_zip(root, slug, zip_path)
+                    addon_store.publish_from_dir(root)
+                    return meta
+
+                meta = await hass.async_add_executor_job(_build_store)
+                commit = await hass.async_add_executor_job(addon_store.publish_from_dir, root)
+
+                reg = await _ensure_store_registered(hass)
+                registered = reg.get("registered")
+                register_error = reg.get("error")
+                await _supervisor_api(hass, "post", "/store/reload")
+
+                store_slug = await _supervisor_store_slug(hass, slug)
+                install_error = None
+                if store_slug:
                     install_resp = await _supervisor_api(
-                        hass, "post", f"/addons/{store_slug}/install"
+                        hass, "post", f"/store/addons/{store_slug}/install"
                     )
-                if install_resp and isinstance(install_resp[1], dict):
-                    install_error = install_resp[1].get("message")
+                    if not (install_resp and install_resp[0] in (200, 201)):
+                        # Older Supervisor uses /addons/<slug>/install.
+                        install_resp = await _supervisor_api(
+                            hass, "post", f"/addons/{store_slug}/install"
+                        )
+                    if install_resp and isinstance(install_resp[1], dict):
+                        install_error = install_resp[1].get("message")
 
-            await _supervisor_api(hass, "post", "/addons/reload")
-            visible = await _supervisor_addon_visible(hass, slug)
+                await _supervisor_api(hass, "post", "/addons/reload")
+                visible = await _supervisor_addon_visible(hass, slug)
 
-            # Fallback for Supervised installs where Core *can* write to the
-            # local add-ons folder directly.
-            if not visible and not store_slug:
-                try:
-                    from .installer import install_package
-                    fs = await install_package(
-                        hass, zip_bytes=zip_bytes, package_type="addon",
-                        repo_name=repo, owner=owner,
-                    )
-                    await _supervisor_api(hass, "post", "/addons/reload")
-                    visible = await _supervisor_addon_visible(hass, slug)
-                    meta = {**meta, **fs}
-                except Exception as exc:
-                    _LOGGER.debug("Filesystem add-on fallback failed: %s", exc)
+                # Fallback for Supervised installs where Core *can* write to the
+                # local add-ons folder directly.
+                if not visible and not store_slug:
+                    try:
+                        from .installer import install_package
+                        fs = await install_package(
+                            hass, zip_path=zip_path, package_type="addon",
+                            repo_name=repo, owner=owner,
+                        )
+                        await _supervisor_api(hass, "post", "/addons/reload")
+                        visible = await _supervisor_addon_visible(hass, slug)
+                        meta = {**meta, **fs}
+                    except Exception as exc:
+                        _LOGGER.debug("Filesystem add-on fallback failed: %s", exc)
+            finally:
+                await hass.async_add_executor_job(shutil.rmtree, download_dir, True)
 
             return web.json_response({
                 "success": True,
@@ -4311,7 +4274,9 @@ class AppsUninstallView(HomeAssistantView):
     async def post(self, request: web.Request) -> web.Response:
         hass = request.app["hass"]
         try:
-            data = await request.json()
+            data = await _read_json_body(request)
+            if data is None:
+                return web.json_response({"error": "Empty body"}, status=400)
             repo = data.get("repo", "").strip()
             if not repo:
                 return web.json_response({"error": "Missing repo"}, status=400)
@@ -4509,9 +4474,21 @@ class ConnectorFetchView(HomeAssistantView):
         headers = {}
         if client.token:
             headers["Authorization"] = f"token {client.token}"
-        from .installer import _download_zip_bytes
-        zip_bytes = await _download_zip_bytes(hass, url, headers=headers)
-        return web.Response(body=zip_bytes, content_type="application/zip")
+        from .installer import _stream_zip
+
+        # Relay the archive as it arrives instead of buffering it first.
+        response = web.StreamResponse(headers={"Content-Type": "application/zip"})
+
+        async def _write(chunk: bytes) -> None:
+            if not response.prepared:
+                await response.prepare(request)
+            await response.write(chunk)
+
+        await _stream_zip(hass, url, headers, _write)
+        if not response.prepared:
+            await response.prepare(request)
+        await response.write_eof()
+        return response
 
 
 class ConnectorResultView(HomeAssistantView):
@@ -4526,7 +4503,9 @@ class ConnectorResultView(HomeAssistantView):
             return web.json_response({"error": "unauthorized"}, status=403)
         _CONNECTOR_STATE["last_seen"] = time.time()
 
-        data = await request.json()
+        data = await _read_json_body(request)
+        if data is None:
+            return web.json_response({"error": "Empty body"}, status=400)
         job = _CONNECTOR_JOBS.get(data.get("id", ""))
         if job:
             job["status"] = "done" if data.get("ok") else "error"
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import logging
+import time
+
+import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 _LOGGER = logging.getLogger(__name__)
 
+# Once a token is rejected, don't re-test it more often than this.
+_AUTH_RECHECK_INTERVAL = 60  # seconds
+
 
 class GiteaClient:
     def __init__(self, hass: HomeAssistant, base_url: str, token: str = None):
@@ -14,6 +20,11 @@ class GiteaClient:
         self.base_url = base_url.rstrip("/")
         self.token = token or None
         self._token_valid = True # Assume valid until proven otherwise
+        self._last_auth_check: float | None = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Return HA's shared HTTP session, which keeps connections alive."""
+        return async_get_clientsession(self.hass)
 
     def _headers(self, use_auth: bool = True) -> dict:
         """Get headers - with or without auth token."""
@@ -28,10 +39,23 @@ class GiteaClient:
             _LOGGER.info("No token - assuming public access")
             return True
 
+        # Refresh loops call this repeatedly; a rejected token won't start
+        # working within seconds, so don't hammer /user while it's invalid.
+        if (
+            not self._token_valid
+            and self._last_auth_check is not None
+            and time.monotonic() - self._last_auth_check < _AUTH_RECHECK_INTERVAL
+        ):
+            return False
+        self._last_auth_check = time.monotonic()
+
+        # Always send the token here — _headers() drops it once it has been
+        # marked invalid, which would make a re-test fail forever.
+        headers = {"Accept": "application/json", "Authorization": f"token {self.token}"}
         try:
-            sess = async_get_clientsession(self.hass)
+            sess = self._session()
             url = f"{self.base_url}/api/v1/user"
-            async with sess.get(url, headers=self._headers(), timeout=20) as resp:
+            async with sess.get(url, headers=headers, timeout=20) as resp:
                 self._token_valid = (resp.status == 200)
                 if not self._token_valid:
                     _LOGGER.warning("Gitea authentication failed - token may be expired or revoked")
@@ -42,7 +66,7 @@ class GiteaClient:
             return False
 
     async def get_repo(self, owner: str, repo: str) -> dict:
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/repos/{owner}/{repo}"
         async with sess.get(url, headers=self._headers(), timeout=30) as resp:
             if resp.status != 200:
@@ -54,7 +78,7 @@ class GiteaClient:
 
     async def get_org_repos(self, org: str) -> list[dict]:
         """Fetch all repositories for an organization."""
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/orgs/{org}/repos"
         async with sess.get(url, headers=self._headers(), timeout=30) as resp:
             if resp.status != 200:
@@ -64,7 +88,7 @@ class GiteaClient:
 
     async def get_user_repos(self, user: str) -> list[dict]:
         """Fetch all repositories for a user."""
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/users/{user}/repos"
         async with sess.get(url, headers=self._headers(), timeout=30) as resp:
             if resp.status != 200:
@@ -74,9 +98,9 @@ class GiteaClient:
 
     async def get_user_orgs(self) -> list[dict]:
         """Fetch all organizations the authenticated user belongs to."""
-        if not self.token:
+        if not (self.token and self._token_valid):
             return []
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/user/orgs"
         async with sess.get(url, headers=self._headers(), timeout=30) as resp:
             if resp.status != 200:
@@ -86,9 +110,9 @@ class GiteaClient:
 
     async def get_current_user(self) -> dict | None:
         """Fetch the authenticated user's info."""
-        if not self.token:
+        if not (self.token and self._token_valid):
             return None
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/user"
         try:
             async with sess.get(url, headers=self._headers(), timeout=20) as resp:
@@ -100,9 +124,9 @@ class GiteaClient:
 
     async def get_user_following(self) -> list[dict]:
         """Fetch users that the authenticated user is following."""
-        if not self.token:
+        if not (self.token and self._token_valid):
             return []
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/user/following"
         try:
             async with sess.get(url, headers=self._headers(), timeout=30) as resp:
@@ -114,7 +138,7 @@ class GiteaClient:
 
     async def get_org_info(self, org: str) -> dict | None:
         """Fetch organization information to get display name."""
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/orgs/{org}"
         try:
             async with sess.get(url, headers=self._headers(), timeout=20) as resp:
@@ -126,7 +150,7 @@ class GiteaClient:
 
     async def get_org_members(self, org: str) -> list[dict]:
         """Fetch all members of an organization."""
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/orgs/{org}/members"
         try:
             async with sess.get(url, headers=self._headers(), timeout=30) as resp:
@@ -138,7 +162,7 @@ class GiteaClient:
 
     async def get_user_info(self, user: str) -> dict | None:
         """Fetch user information to get display name."""
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/users/{user}"
         try:
             async with sess.get(url, headers=self._headers(), timeout=20) as resp:
@@ -150,7 +174,7 @@ class GiteaClient:
 
     async def get_releases(self, owner: str, repo: str) -> list[dict]:
         """Fetch all releases for a repository."""
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/repos/{owner}/{repo}/releases"
         try:
             async with sess.get(url, headers=self._headers(), timeout=30) as resp:
@@ -162,38 +186,34 @@ class GiteaClient:
 
     async def get_file_content(self, owner: str, repo: str, file_path: str, branch: str = "main") -> str | None:
         """Fetch content of a specific file."""
-        sess = async_get_clientsession(self.hass)
-        url = f"{self.base_url}/api/v1/repos/{owner}/{repo}/contents/{file_path}?ref={branch}"
+        sess = self._session()
+        # The raw endpoint returns the file bytes directly, skipping the
+        # JSON envelope and base64 decode of the contents endpoint.
+        url = f"{self.base_url}/api/v1/repos/{owner}/{repo}/raw/{file_path}?ref={branch}"
         try:
             async with sess.get(url, headers=self._headers(), timeout=20) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
-                    import base64
-                    content = base64.b64decode(data["content"]).decode("utf-8")
-                    return content
+                    return await resp.text(encoding="utf-8")
         except Exception:
             pass
         return None
 
     async def get_readme(self, owner: str, repo: str) -> str | None:
         """Fetch the README content for a repository."""
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         # Try README.md, then readme.md, then README
         for name in ["README.md", "readme.md", "README"]:
-            url = f"{self.base_url}/api/v1/repos/{owner}/{repo}/contents/{name}"
+            url = f"{self.base_url}/api/v1/repos/{owner}/{repo}/raw/{name}"
             try:
                 async with sess.get(url, headers=self._headers(), timeout=20) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
-                        import base64
-                        content = base64.b64decode(data["content"]).decode("utf-8")
-                        return content
+                        return await resp.text(encoding="utf-8")
             except Exception:
                 continue
         return None
 
     async def get_latest_release(self, owner: str, repo: str) -> dict:
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/repos/{owner}/{repo}/releases/latest"
         async with sess.get(url, headers=self._headers(), timeout=30) as resp:
             if resp.status != 200:
@@ -202,7 +222,7 @@ class GiteaClient:
             return await resp.json()
 
     async def get_release_by_tag(self, owner: str, repo: str, tag: str) -> dict:
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         url = f"{self.base_url}/api/v1/repos/{owner}/{repo}/releases/tags/{tag}"
         async with sess.get(url, headers=self._headers(), timeout=30) as resp:
             if resp.status != 200:
@@ -246,7 +266,7 @@ class GiteaClient:
         rather than N.
         """
         import asyncio
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         per_page = 50
         max_pages = max(1, (limit + per_page - 1) // per_page)
 
@@ -306,7 +326,7 @@ class GiteaClient:
 
         Returns a list of entries with keys like: name, path, type ('file'/'dir').
         """
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         p = path.strip("/")
 
         url = f"{self.base_url}/api/v1/repos/{owner}/{repo}/contents/{p}?ref={branch}"
@@ -332,7 +352,7 @@ class GiteaClient:
 
     async def get_file_commits(self, owner: str, repo: str, file_path: str, branch: str = "main", limit: int = 1) -> list[dict]:
         """Fetch commit history for a specific file."""
-        sess = async_get_clientsession(self.hass)
+        sess = self._session()
         p = file_path.strip("/")
         url = f"{self.base_url}/api/v1/repos/{owner}/{repo}/commits?path={p}&sha={branch}&limit={limit}"
         try:
@@ -1,16 +1,48 @@
 from __future__ import annotations
 
-import io
 import json
+import logging
+import os
 import shutil
+import struct
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import AUDIO_VENDOR_FOLDER, LOVELACE_VENDOR_FOLDER
+from .const import AUDIO_VENDOR_FOLDER, LOVELACE_VENDOR_FOLDER, ZIP_FAST_INFLATE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Optional zlib-compatible backends with SIMD-accelerated DEFLATE. Neither
+# is a requirement; without them extraction uses the stdlib zipfile path.
+try:
+    from isal import isal_zlib as _fast_zlib
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as _fast_zlib
+    except ImportError:
+        _fast_zlib = None
+
+# Member streaming buffer; large enough that a typical JS chunk or Python
+# module is a single read and write.
+_COPY_BUFSIZE = 2 * 1024 * 1024
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Archives with fewer file members than this are not worth a thread pool.
+_PARALLEL_EXTRACT_MIN_MEMBERS = 8
+_ICON_SUFFIXES = {".png", ".svg", ".jpg", ".jpeg", ".webp"}
+# Lowercased icon file name -> the brand role it fills.
+_ICON_ROLES = {
+    "icon.png": "main",
+    "icon.svg": "main",
+    "icon@2x.png": "2x",
+    "icon_2x.png": "2x",
+    "logo.png": "logo",
+    "logo.svg": "logo",
+}
 
 
 def _detect_single_top_folder(extract_dir: Path) -> Path:
@@ -20,28 +52,318 @@ def _detect_single_top_folder(extract_dir: Path) -> Path:
     return extract_dir
 
 
+def _remove_tree(path: Path) -> bool:
+    """Delete a directory tree; return False if it wasn't there.
+
+    Letting rmtree report the missing path saves the exists() stat that
+    used to guard every removal. Other errors still propagate.
+    """
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _copy_file(src: Path, dst: Path, st: os.stat_result | None = None) -> None:
+    """Copy file contents and keep the source's timestamps.
+
+    shutil.copyfile does the transfer with sendfile() on Linux, so the
+    bytes never pass through a userspace buffer.
+    """
+    shutil.copyfile(src, dst)
+    if st is None:
+        st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _link_or_copy(src: Path, dst: Path, st: os.stat_result | None = None) -> None:
+    """Hard-link src to dst, copying instead when a link isn't possible.
+
+    Archives are staged on the config volume, so for most installs this
+    turns a full read and write of the file into a single inode update.
+    Cross-device targets (EXDEV) and filesystems without hard links fall
+    back to a regular copy.
+    """
+    try:
+        dst.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        _copy_file(src, dst, st)
+
+
+def _move_tree(src: Path, dest: Path) -> None:
+    """Move a directory to a dest that doesn't exist yet.
+
+    A rename when both sit on the same filesystem; otherwise a merge into
+    a fresh dest, which still hard-links where it can.
+    """
+    try:
+        os.replace(src, dest)
+    except OSError:
+        _copytree_merge(src, dest)
+
+
+def _place_icon(src: Path, dest: Path) -> None:
+    """Link (or copy) an icon to dest unless it already is that file."""
+    try:
+        if os.path.samefile(src, dest):
+            return
+    except FileNotFoundError:
+        pass
+    _link_or_copy(src, dest)
+
+
 def _copytree_merge(src: Path, dst: Path) -> None:
+    # scandir entries carry d_type, so telling files from directories
+    # costs no stat; the stat for the copy fallback is cached on the entry.
+    dirs: list[Path] = []
+    files: list[tuple[os.DirEntry, Path]] = []
+    pending = [(src, dst)]
+    while pending:
+        src_dir, dst_dir = pending.pop()
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = dst_dir / entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(target)
+                    pending.append((Path(entry.path), target))
+                else:
+                    files.append((entry, target))
+
+    # Create the whole tree up front. A directory is always recorded before
+    # its children, so each one is a single mkdir and the file copies below
+    # need none at all.
     dst.mkdir(parents=True, exist_ok=True)
-    for item in src.rglob("*"):
-        rel = item.relative_to(src)
-        target = dst / rel
-        if item.is_dir():
-            target.mkdir(parents=True, exist_ok=True)
+    for directory in dirs:
+        try:
+            directory.mkdir()
+        except FileExistsError:
+            pass
+    for entry, target in files:
+        try:
+            st = entry.stat()
+        except OSError:
+            st = None
+        _link_or_copy(Path(entry.path), target, st)
+
+
+def _subdir_names(path: Path) -> set[str]:
+    """Names of the directories directly inside path (empty if missing)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it if entry.is_dir()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _icon_files_in(folder: Path) -> list[Path]:
+    # DirEntry.is_file() answers from the cached d_type, no stat per entry.
+    with os.scandir(folder) as it:
+        return [
+            Path(entry.path) for entry in it
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in _ICON_SUFFIXES
+        ]
+
+
+def _use_fast_inflate() -> bool:
+    return ZIP_FAST_INFLATE and _fast_zlib is not None
+
+
+def _is_plain_member_name(name: str) -> bool:
+    """Whether a member name can be joined onto the target as-is.
+
+    Anything unusual (absolute paths, '..', backslashes, drive letters) is
+    left to zipfile, which knows how to sanitize it.
+    """
+    if not name or name.startswith("/") or "\\" in name or ":" in name:
+        return False
+    return ".." not in name.split("/")
+
+
+def _member_data_offset(fp, info: zipfile.ZipInfo) -> int:
+    """Return where a member's compressed bytes start in the archive."""
+    fp.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, fp.read(zipfile.sizeFileHeader))
+    # Fields 0, 10 and 11: signature, file name length, extra field length.
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename!r}")
+    return info.header_offset + zipfile.sizeFileHeader + header[10] + header[11]
+
+
+def _inflate_member(fp, info: zipfile.ZipInfo, dest: Path) -> None:
+    """Inflate (or, for STORED, copy) one member into dest.
+
+    Both the inflate and the CRC-32 check go through the fast backend,
+    whose crc32 uses carry-less multiply instructions where available
+    instead of zlib's table-driven loop.
+    """
+    fp.seek(_member_data_offset(fp, info))
+    remaining = info.compress_size
+    crc32 = _fast_zlib.crc32
+    decomp = _fast_zlib.decompressobj(-15) if info.compress_type == zipfile.ZIP_DEFLATED else None
+    crc = 0
+    size = 0
+    with open(dest, "wb") as out:
+        while remaining:
+            chunk = fp.read(min(remaining, _COPY_BUFSIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated member {info.filename!r}")
+            remaining -= len(chunk)
+            if decomp is None:
+                crc = crc32(chunk, crc)
+                size += len(chunk)
+                out.write(chunk)
+                continue
+            # Cap each output block so a highly compressible member can't
+            # balloon a single decompress call.
+            while chunk:
+                data = decomp.decompress(chunk, _COPY_BUFSIZE)
+                crc = crc32(data, crc)
+                size += len(data)
+                # Stop a member lying about its size as soon as it overruns.
+                if size > info.file_size:
+                    raise zipfile.BadZipFile(f"Bad size for file {info.filename!r}")
+                out.write(data)
+                chunk = decomp.unconsumed_tail
+        if decomp is not None:
+            data = decomp.flush()
+            crc = crc32(data, crc)
+            size += len(data)
+            out.write(data)
+    if size != info.file_size:
+        raise zipfile.BadZipFile(f"Bad size for file {info.filename!r}")
+    if crc != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+
+
+def _extract_member(zf: zipfile.ZipFile, fp, info: zipfile.ZipInfo, extract_to: Path) -> None:
+    """Extract one member, using the fast inflate backend when it applies."""
+    if info.is_dir() or not _is_plain_member_name(info.filename):
+        zf.extract(info, extract_to)
+        return
+    dest = extract_to / info.filename
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if (
+        _use_fast_inflate()
+        and info.compress_type in (zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED)
+        and not info.flag_bits & 0x1  # encrypted
+    ):
+        _inflate_member(fp, info, dest)
+        return
+    # Same as zf.extract for a plain name, but with a 2 MiB buffer instead
+    # of copyfileobj's default.
+    with zf.open(info) as src, open(dest, "wb") as out:
+        shutil.copyfileobj(src, out, _COPY_BUFSIZE)
+
+
+def _extract_members(open_fp, members: list[zipfile.ZipInfo], extract_to: Path) -> None:
+    """Extract members through a private pair of archive handles.
+
+    Each worker thread gets its own, so neither zipfile's file position nor
+    the raw read handle is ever shared. The raw handle is separate from the
+    ZipFile one for the same reason.
+    """
+    with open_fp() as zip_fp, zipfile.ZipFile(zip_fp) as zf, open_fp() as fp:
+        for info in members:
+            _extract_member(zf, fp, info, extract_to)
+
+
+def _archive_top_folder(names: list[str]) -> str | None:
+    """The folder every member sits in, as _detect_single_top_folder sees it."""
+    tops = {name.split("/", 1)[0] for name in names}
+    if len(tops) != 1:
+        return None
+    top = tops.pop()
+    prefix = f"{top}/"
+    return top if any(name.startswith(prefix) for name in names) else None
+
+
+def _install_members(
+    infos: list[zipfile.ZipInfo], package_type: str, repo_name: str
+) -> list[zipfile.ZipInfo]:
+    """Members an install of package_type will actually read.
+
+    Release archives carry docs, tests and sources the installers never
+    look at; leaving them out skips their inflate and write entirely.
+    Anything unusual (no single top folder, names zipfile must sanitize)
+    keeps the whole archive.
+    """
+    names = [info.filename for info in infos]
+    top = _archive_top_folder(names)
+    if top is None or not all(_is_plain_member_name(name) for name in names):
+        return infos
+    strip = len(top) + 1
+    rels = [name[strip:] for name in names]
+
+    if package_type == "integration":
+        prefixes: tuple[str, ...] = ("custom_components/", "icons/", "Icons/")
+    elif package_type == "blueprints":
+        prefixes = ("blueprints/",)
+    elif package_type == "lovelace":
+        # Mirrors the dist/ -> <repo>/ -> everything order of
+        # _install_lovelace_from_extracted; hacs.json is always read.
+        for folder in ("dist/", f"{repo_name}/"):
+            if any(rel.startswith(folder) for rel in rels):
+                prefixes = (folder,)
+                break
         else:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, target)
+            return infos
+        return [
+            info for info, rel in zip(infos, rels)
+            if rel == "hacs.json" or rel.startswith(prefixes)
+        ]
+    else:
+        return infos
+    return [info for info, rel in zip(infos, rels) if rel.startswith(prefixes)]
+
 
+def _extract_with(open_fp, extract_to: Path, select=None) -> None:
+    """Extract an archive; ``open_fp()`` returns a fresh binary handle on it.
 
-def _extract_zip_bytes(zip_bytes: bytes, extract_to: Path) -> None:
+    ``select`` optionally narrows ``zf.infolist()`` to the members needed.
+    """
     extract_to.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
-        zf.extractall(extract_to)
+    with open_fp() as zip_fp, zipfile.ZipFile(zip_fp) as zf:
+        files = []
+        infos = zf.infolist()
+        for info in select(infos) if select is not None else infos:
+            if info.is_dir() or not _is_plain_member_name(info.filename):
+                # Directories and names zipfile has to sanitize are handled
+                # up front, so workers never race on creating directories.
+                zf.extract(info, extract_to)
+            else:
+                files.append(info)
+
+    workers = min(os.cpu_count() or 1, len(files) // _PARALLEL_EXTRACT_MIN_MEMBERS or 1)
+    if workers <= 1:
+        _extract_members(open_fp, files, extract_to)
+        return
+
+    for parent in sorted({(extract_to / info.filename).parent for info in files}):
+        parent.mkdir(parents=True, exist_ok=True)
+    # Largest first onto the least loaded worker keeps one big member
+    # from serializing the tail of the extraction.
+    chunks: list[list[zipfile.ZipInfo]] = [[] for _ in range(workers)]
+    loads = [0] * workers
+    for info in sorted(files, key=lambda i: i.compress_size, reverse=True):
+        idx = loads.index(min(loads))
+        chunks[idx].append(info)
+        loads[idx] += info.compress_size
+    # zlib releases the GIL while inflating, so threads scale across cores.
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yidstore_unzip") as pool:
+        for fut in [pool.submit(_extract_members, open_fp, chunk, extract_to) for chunk in chunks]:
+            fut.result()
+
+
+def _extract_zip_file(zip_path: Path, extract_to: Path, select=None) -> None:
+    _extract_with(lambda: open(zip_path, "rb"), extract_to, select)
 
 
 def _install_integration_from_extracted(extracted_root: Path, ha_custom_components: Path) -> list[str]:
-    import logging
-    _LOGGER = logging.getLogger(__name__)
-
     cc = extracted_root / "custom_components"
     if not cc.exists():
         raise RuntimeError("Integration install expected 'custom_components/<domain>/' in the zip/zipball.")
@@ -49,83 +371,85 @@ def _install_integration_from_extracted(extracted_root: Path, ha_custom_componen
     ha_custom_components.mkdir(parents=True, exist_ok=True)
 
     installed_domains: list[str] = []
+    root_subdirs = _subdir_names(extracted_root)
 
     for domain_dir in cc.iterdir():
         if not domain_dir.is_dir():
             continue
         target = ha_custom_components / domain_dir.name
-        if target.exists():
-            shutil.rmtree(target)
-        shutil.copytree(domain_dir, target)
+        _remove_tree(target)
+        # The archive is staged on the same volume, so the whole domain
+        # folder moves into place with one rename instead of a copy.
+        try:
+            os.replace(domain_dir, target)
+        except OSError:
+            shutil.copytree(domain_dir, target)
         installed_domains.append(domain_dir.name)
 
         # Look for branding files in common locations and store them under
         # custom_components/<domain>/brand for Home Assistant branding pickup.
-        icons_folders = [
-            domain_dir / "brand",
-            domain_dir / "Brand",
-            extracted_root / "icons",
-            extracted_root / "Icons",
-            domain_dir / "icons",
-            domain_dir / "Icons",
-        ]
+        domain_subdirs = _subdir_names(target)
+        icons_folders = (
+            [target / name for name in ("brand", "Brand") if name in domain_subdirs]
+            + [extracted_root / name for name in ("icons", "Icons") if name in root_subdirs]
+            + [target / name for name in ("icons", "Icons") if name in domain_subdirs]
+        )
 
         icon_files = []
         for folder in icons_folders:
-            if folder.exists() and folder.is_dir():
-                icon_files.extend(
-                    [
-                        p for p in folder.iterdir()
-                        if p.is_file() and p.suffix.lower() in {".png", ".svg", ".jpg", ".jpeg", ".webp"}
-                    ]
-                )
+            icon_files.extend(_icon_files_in(folder))
 
         if icon_files:
-            _LOGGER.info("Found %d icon files for %s", len(icon_files), domain_dir.name)
-
-            # Find icon files - look for common naming patterns
-            main_icon = None
-            icon_2x = None
-            logo = None
+            _LOGGER.debug("Found %d icon files for %s", len(icon_files), domain_dir.name)
 
+            # Find icon files - look for common naming patterns. Any PNG/SVG
+            # stands in for the main icon until a real icon.* turns up.
+            roles: dict[str, Path] = {}
             for icon_file in icon_files:
                 name_lower = icon_file.name.lower()
-                if name_lower in ['icon.png', 'icon.svg']:
-                    main_icon = icon_file
-                elif name_lower in ['icon@2x.png', 'icon_2x.png']:
-                    icon_2x = icon_file
-                elif name_lower in ['logo.png', 'logo.svg']:
-                    logo = icon_file
-                elif name_lower.endswith('.png') or name_lower.endswith('.svg'):
-                    if main_icon is None:
-                        main_icon = icon_file
-
-            # Copy to custom_components/<domain>/brand.
+                role = _ICON_ROLES.get(name_lower)
+                if role is not None:
+                    roles[role] = icon_file
+                elif "main" not in roles and name_lower.endswith((".png", ".svg")):
+                    roles["main"] = icon_file
+            main_icon = roles.get("main")
+            icon_2x = roles.get("2x")
+            logo = roles.get("logo")
+
+            # Place each icon in custom_components/<domain>/brand once; the
+            # icon/logo role names below are hard links to that copy rather
+            # than second reads of the source.
             brand_target = target / "brand"
             brand_target.mkdir(parents=True, exist_ok=True)
             for icon_file in icon_files:
-                dest_file = brand_target / icon_file.name
-                shutil.copy2(icon_file, dest_file)
+                _place_icon(icon_file, brand_target / icon_file.name)
 
             if main_icon:
                 dest_icon = brand_target / "icon.png"
                 if not dest_icon.exists() or main_icon.name.lower() != 'icon.png':
-                    shutil.copy2(main_icon, dest_icon)
-                    _LOGGER.info("Created brand/icon.png from %s", main_icon.name)
+                    _place_icon(brand_target / main_icon.name, dest_icon)
+                    _LOGGER.debug("Created brand/icon.png from %s", main_icon.name)
 
             if icon_2x:
                 dest_icon_2x = brand_target / "icon@2x.png"
                 if not dest_icon_2x.exists():
-                    shutil.copy2(icon_2x, dest_icon_2x)
-                    _LOGGER.info("Created brand/icon@2x.png")
+                    _place_icon(brand_target / icon_2x.name, dest_icon_2x)
+                    _LOGGER.debug("Created brand/icon@2x.png")
 
             if logo:
                 dest_logo = brand_target / "logo.png"
                 if not dest_logo.exists():
-                    shutil.copy2(logo, dest_logo)
-                    _LOGGER.info("Created brand/logo.png")
-
-            _LOGGER.info("Icons installed for %s", domain_dir.name)
+                    _place_icon(brand_target / logo.name, dest_logo)
+                    _LOGGER.debug("Created brand/logo.png")
+
+            _LOGGER.info(
+                "Icons installed for %s: %d files, main=%s, 2x=%s, logo=%s",
+                domain_dir.name,
+                len(icon_files),
+                main_icon.name if main_icon else None,
+                icon_2x.name if icon_2x else None,
+                logo.name if logo else None,
+            )
 
     return installed_domains
 
@@ -150,28 +474,53 @@ def _find_hacs_filename(extracted_root: Path) -> str | None:
 
 
 def _find_main_js(dest: Path, repo_name: str, preferred_name: str | None = None) -> str | None:
+    candidates: list[str] = []
     if preferred_name:
         candidates = [preferred_name]
         if preferred_name.startswith("dist/"):
             candidates.append(preferred_name[5:])
         candidates.append(f"dist/{preferred_name}")
-        for candidate in candidates:
-            preferred_path = dest / candidate
-            if preferred_path.is_file():
-                return str(preferred_path.relative_to(dest)).replace("\\", "/")
-
-    preferred = dest / f"{repo_name}.js"
-    if preferred.exists():
-        return preferred.name
-
-    root_js = sorted([p for p in dest.glob("*.js") if p.is_file() and not p.name.endswith(".map")])
-    if root_js:
-        return root_js[0].name
-
-    js_files = sorted([p for p in dest.rglob("*.js") if p.is_file() and not p.name.endswith(".map")])
-    if not js_files:
-        return None
-    return str(js_files[0].relative_to(dest)).replace("\\", "/")
+        candidates = [Path(candidate).as_posix() for candidate in candidates]
+    repo_js = f"{repo_name}.js"
+
+    # One top-down walk (the root comes first), keeping only the best hit
+    # per lookup tier instead of collecting and sorting every .js file.
+    preferred_hits: set[str] = set()
+    has_repo_js = False
+    root_best: str | None = None
+    any_best: tuple[str, ...] | None = None
+    for dirpath, _dirs, files in os.walk(dest):
+        rel_dir = Path(dirpath).relative_to(dest).parts
+        for name in files:
+            parts = rel_dir + (name,)
+            # hacs.json may name a non-.js bundle (e.g. card.mjs); match the
+            # preferred names before filtering on the extension.
+            if candidates:
+                rel = "/".join(parts)
+                if rel in candidates:
+                    if rel == candidates[0]:
+                        return rel
+                    preferred_hits.add(rel)
+            if not name.endswith(".js"):
+                continue
+            if not rel_dir:
+                has_repo_js = has_repo_js or name == repo_js
+                if root_best is None or name < root_best:
+                    root_best = name
+            if any_best is None or parts < any_best:
+                any_best = parts
+        if not rel_dir and not candidates and root_best is not None:
+            # Nothing deeper can beat a root-level match.
+            return repo_js if has_repo_js else root_best
+
+    for candidate in candidates:
+        if candidate in preferred_hits:
+            return candidate
+    if has_repo_js:
+        return repo_js
+    if root_best is not None:
+        return root_best
+    return "/".join(any_best) if any_best else None
 
 
 def _install_lovelace_from_extracted(
@@ -181,9 +530,6 @@ def _install_lovelace_from_extracted(
     *,
     use_vendor_folder: bool = True,
 ) -> tuple[str, str]:
-    import logging
-    _LOGGER = logging.getLogger(__name__)
-
     # Gitea store cards are namespaced under onoff; GitHub custom cards use
     # the normal HACS-style community/<repo> path.
     base_folder = ha_www_community / LOVELACE_VENDOR_FOLDER if use_vendor_folder else ha_www_community
@@ -198,18 +544,15 @@ def _install_lovelace_from_extracted(
     _LOGGER.info("✓ Vendor folder ready (other repos preserved)")
 
     # Remove only this specific repo folder if it exists (for clean reinstall)
-    if dest.exists():
-        _LOGGER.info("  Removing old installation: %s", dest)
-        shutil.rmtree(dest)
-
-    # Create fresh repo folder
-    dest.mkdir(parents=True, exist_ok=True)
-    _LOGGER.info("✓ Destination prepared: %s", dest)
+    if _remove_tree(dest):
+        _LOGGER.info("  Removed old installation: %s", dest)
 
+    # dest is gone now, so dist/ or the repo folder can simply be renamed
+    # into place from the staging dir.
     dist = extracted_root / "dist"
-    if dist.exists() and dist.is_dir():
-        _LOGGER.info("Found dist/ folder, copying files")
-        _copytree_merge(dist, dest)
+    if dist.is_dir():
+        _LOGGER.info("Found dist/ folder, moving files")
+        _move_tree(dist, dest)
         main_js = _find_main_js(dest, repo_name, hacs_filename)
         if not main_js:
             raise RuntimeError("Lovelace install: dist/ found but no .js files were found to register.")
@@ -217,15 +560,17 @@ def _install_lovelace_from_extracted(
         return main_js, str(dest.relative_to(ha_www_community)).replace("\\", "/")
 
     repo_folder = extracted_root / repo_name
-    if repo_folder.exists() and repo_folder.is_dir():
-        _LOGGER.info("Found repo folder %s, copying files", repo_name)
-        _copytree_merge(repo_folder, dest)
+    if repo_folder.is_dir():
+        _LOGGER.info("Found repo folder %s, moving files", repo_name)
+        _move_tree(repo_folder, dest)
         main_js = _find_main_js(dest, repo_name, hacs_filename)
         if not main_js:
             raise RuntimeError("Lovelace install: repo folder copied but no .js files were found to register.")
         _LOGGER.info("Found main JS file: %s", main_js)
         return main_js, str(dest.relative_to(ha_www_community)).replace("\\", "/")
 
+    # The root may be the staging dir itself, which can't be moved away
+    # from under its TemporaryDirectory; merge it (hard links) instead.
     _LOGGER.info("Copying all files from root")
     _copytree_merge(extracted_root, dest)
     main_js = _find_main_js(dest, repo_name, hacs_filename)
@@ -261,9 +606,6 @@ def _install_addon_from_extracted(
     repo_name: str,
 ) -> dict:
     """Install add-on files to the local add-ons directory for Supervisor discovery."""
-    import logging
-    _LOGGER = logging.getLogger(__name__)
-
     addons_root: Path | None = None
     for candidate in (Path("/addons"), Path("/config/addons")):
         if candidate.is_dir():
@@ -287,8 +629,7 @@ def _install_addon_from_extracted(
 
     slug = repo_name.lower().replace("-", "_")
     dest = addons_root / slug
-    if dest.exists():
-        shutil.rmtree(dest)
+    _remove_tree(dest)
     dest.mkdir(parents=True, exist_ok=True)
 
     _copytree_merge(extracted_root, dest)
@@ -319,9 +660,6 @@ def _install_audio_from_extracted(
     the default ``<owner>/<repo>`` destination so users can choose where the
     tracks land.
     """
-    import logging
-
-    _LOGGER = logging.getLogger(__name__)
     owner_slug = (owner or "").strip()
     if not owner_slug:
         raise RuntimeError("Audio install requires a repository owner.")
@@ -360,7 +698,7 @@ def _install_audio_from_extracted(
         # otherwise preserve the repo's structure.
         target = dest / (Path(rel).name if subfolder else rel)
         target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, target)
+        _link_or_copy(src, target)
         copied += 1
 
     if copied == 0:
@@ -375,45 +713,78 @@ def _install_audio_from_extracted(
     }
 
 
-async def _download_zip_bytes(hass: HomeAssistant, url: str, headers: dict) -> bytes:
+def _download_retry_url(url: str, err: RuntimeError) -> str | None:
+    """Return the URL to retry a failed archive download with, if any."""
+    msg = str(err)
+    if "unrecognized repository reference" in msg and "/archive/" in url and url.endswith(".zip"):
+        marker = "/archive/"
+        idx = url.find(marker)
+        if idx != -1:
+            prefix = url[: idx + len(marker)]
+            rest = url[idx + len(marker) :]
+            if not rest.startswith("v"):
+                return prefix + "v" + rest
+    # GitHub archive fallback: repo has no releases and its default
+    # branch is master, not main.
+    if "github.com/" in url and url.endswith("/archive/main.zip") and "404" in msg:
+        return url.replace("/archive/main.zip", "/archive/master.zip")
+    return None
+
+
+async def _check_download_response(resp) -> None:
+    if resp.status != 200:
+        # Keep the body server-side only — it can contain the store URL.
+        body = await resp.text()
+        _LOGGER.debug("Download failed %s: %s", resp.status, body)
+        # Preserve the marker the retry logic looks for, without
+        # exposing the URL to the user.
+        hint = "unrecognized repository reference" if "unrecognized repository reference" in body else ""
+        raise RuntimeError(f"Download failed: {resp.status} {hint}".strip())
+
+
+async def _stream_zip(hass: HomeAssistant, url: str, headers: dict, write) -> None:
+    """Download a zip, handing each chunk to ``await write(chunk)``.
+
+    A bad tag/branch reference is retried before any data is written.
+    """
     sess = async_get_clientsession(hass)
 
-    async def _get(u: str) -> bytes:
+    async def _get(u: str) -> None:
         async with sess.get(u, headers=headers, timeout=120) as resp:
-            if resp.status != 200:
-                # Keep the body server-side only — it can contain the store URL.
-                body = await resp.text()
-                logging.getLogger(__name__).debug("Download failed %s: %s", resp.status, body)
-                # Preserve the marker the retry logic below looks for, without
-                # exposing the URL to the user.
-                hint = "unrecognized repository reference" if "unrecognized repository reference" in body else ""
-                raise RuntimeError(f"Download failed: {resp.status} {hint}".strip())
-            return await resp.read()
+            await _check_download_response(resp)
+            async for chunk in resp.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                await write(chunk)
 
     try:
-        return await _get(url)
+        await _get(url)
     except RuntimeError as err:
-        msg = str(err)
-        if "unrecognized repository reference" in msg and "/archive/" in url and url.endswith(".zip"):
-            marker = "/archive/"
-            idx = url.find(marker)
-            if idx != -1:
-                prefix = url[: idx + len(marker)]
-                rest = url[idx + len(marker) :]
-                if not rest.startswith("v"):
-                    retry_url = prefix + "v" + rest
-                    return await _get(retry_url)
-        # GitHub archive fallback: repo has no releases and its default
-        # branch is master, not main.
-        if "github.com/" in url and url.endswith("/archive/main.zip") and "404" in msg:
-            return await _get(url.replace("/archive/main.zip", "/archive/master.zip"))
-        raise
+        retry_url = _download_retry_url(url, err)
+        if retry_url is None:
+            raise
+        await _get(retry_url)
+
+
+async def _download_zip_file(hass: HomeAssistant, url: str, headers: dict, dest_path: Path) -> None:
+    """Stream a zip download to ``dest_path`` chunk by chunk.
+
+    Memory stays flat regardless of archive size, instead of holding the
+    whole archive in RAM during the install.
+    """
+    f = await hass.async_add_executor_job(open, dest_path, "wb")
+
+    async def _write(chunk: bytes) -> None:
+        await hass.async_add_executor_job(f.write, chunk)
+
+    try:
+        await _stream_zip(hass, url, headers, _write)
+    finally:
+        await hass.async_add_executor_job(f.close)
 
 
 async def install_package(
     hass: HomeAssistant,
     *,
-    zip_bytes: bytes,
+    zip_path: Path,
     package_type: str,
     repo_name: str,
     owner: str | None = None,
@@ -422,6 +793,7 @@ async def install_package(
     audio_subfolder: str | None = None,
     source: str | None = None,
 ) -> dict:
+    config_dir = Path(hass.config.path())
     ha_custom_components = Path(hass.config.path("custom_components"))
     ha_www_community = Path(hass.config.path("www", "community"))
     ha_www_root = Path(hass.config.path("www"))
@@ -432,9 +804,16 @@ async def install_package(
     hacs_present = "hacs" in hass.data
 
     def _work() -> dict:
-        with tempfile.TemporaryDirectory(prefix="yidstore_") as td:
+        # Stage next to the install targets (not in /tmp, which is often a
+        # different filesystem) so files can be renamed or hard-linked into
+        # place rather than copied.
+        with tempfile.TemporaryDirectory(prefix=".yidstore_staging_", dir=config_dir) as td:
             extract_dir = Path(td)
-            _extract_zip_bytes(zip_bytes, extract_dir)
+
+            def _select(infos: list[zipfile.ZipInfo]) -> list[zipfile.ZipInfo]:
+                return _install_members(infos, package_type, repo_name)
+
+            _extract_zip_file(zip_path, extract_dir, _select)
             root = _detect_single_top_folder(extract_dir)
 
             if package_type == "integration":
@@ -454,8 +833,6 @@ async def install_package(
                 else:
                     dest_url = f"/local/community/{relative_dest}/{main_js}"
                 result = {"main_js": main_js, "dest_url": dest_url}
-                import logging
-                _LOGGER = logging.getLogger(__name__)
                 _LOGGER.info("Lovelace install complete: %s", result)
                 return result
 
@@ -496,18 +873,23 @@ async def download_and_install(
     audio_subfolder: str | None = None,
     source: str | None = None,
 ) -> dict:
-    zip_bytes = await _download_zip_bytes(hass, url, headers=headers)
-    return await install_package(
-        hass,
-        zip_bytes=zip_bytes,
-        package_type=package_type,
-        repo_name=repo_name,
-        owner=owner,
-        audio_location=audio_location,
-        audio_files=audio_files,
-        audio_subfolder=audio_subfolder,
-        source=source,
-    )
+    download_dir = Path(await hass.async_add_executor_job(tempfile.mkdtemp, None, "yidstore_dl_"))
+    try:
+        zip_path = download_dir / "archive.zip"
+        await _download_zip_file(hass, url, headers, zip_path)
+        return await install_package(
+            hass,
+            zip_path=zip_path,
+            package_type=package_type,
+            repo_name=repo_name,
+            owner=owner,
+            audio_location=audio_location,
+            audio_files=audio_files,
+            audio_subfolder=audio_subfolder,
+            source=source,
+        )
+    finally:
+        await hass.async_add_executor_job(shutil.rmtree, download_dir, True)
 
 
 def uninstall_package(
@@ -518,38 +900,31 @@ def uninstall_package(
     domain: str | None = None,
 ) -> None:
     """Best effort uninstall of a package by deleting its folder."""
-    import logging
-    _LOGGER = logging.getLogger(__name__)
-    
     if package_type == "lovelace":
         for dest in (
             Path(hass.config.path("www", "community", LOVELACE_VENDOR_FOLDER, repo_name)),
             Path(hass.config.path("www", "community", repo_name)),
         ):
-            if dest.exists():
-                _LOGGER.info("Uninstalling Lovelace card: %s", dest)
-                shutil.rmtree(dest)
+            if _remove_tree(dest):
+                _LOGGER.info("Uninstalled Lovelace card: %s", dest)
 
     elif package_type == "audio":
         if not owner:
             _LOGGER.warning("Audio uninstall skipped: missing owner for repo %s", repo_name)
             return
         dest_www = Path(hass.config.path("www", AUDIO_VENDOR_FOLDER, owner, repo_name))
-        if dest_www.exists():
-            _LOGGER.info("Uninstalling audio package: %s", dest_www)
-            shutil.rmtree(dest_www)
+        if _remove_tree(dest_www):
+            _LOGGER.info("Uninstalled audio package: %s", dest_www)
         dest_media = Path(hass.config.path("media", AUDIO_VENDOR_FOLDER, owner, repo_name))
-        if dest_media.exists():
-            _LOGGER.info("Uninstalling audio package: %s", dest_media)
-            shutil.rmtree(dest_media)
+        if _remove_tree(dest_media):
+            _LOGGER.info("Uninstalled audio package: %s", dest_media)
             
     elif package_type == "addon":
         slug = repo_name.lower().replace("-", "_")
         for root in (Path("/addons"), Path("/config/addons")):
             dest = root / slug
-            if dest.exists():
-                _LOGGER.info("Uninstalling add-on: %s", dest)
-                shutil.rmtree(dest)
+            if _remove_tree(dest):
+                _LOGGER.info("Uninstalled add-on: %s", dest)
 
     elif package_type == "integration":
         domains: list[str] = []
@@ -565,6 +940,5 @@ def uninstall_package(
                 continue
             seen.add(dom)
             dest = cc_root / dom
-            if dest.exists():
-                _LOGGER.info("Uninstalling integration: %s", dest)
-                shutil.rmtree(dest)
+            if _remove_tree(dest):
+                _LOGGER.info("Uninstalled integration: %s", dest)
@@ -96,6 +96,7 @@ class PackageVersionSensor(SensorEntity):
         """Initialize the sensor."""
         self._coordinator = coordinator
         self._package_id = package_id
+        self._pkg_data = package_data
         self._entry_id = entry_id
         self._attr_name = f"{package_data['repo_name']} Version"
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{package_id}_version"
@@ -104,31 +105,29 @@ class PackageVersionSensor(SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info - dynamically updated."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._package_id)},
-            name=package_data.get('repo_name', 'Unknown'),
-            manufacturer="OnOff Integration Store",
-            model=package_data.get('package_type', 'unknown').title(),
-            sw_version=package_data.get('installed_version', 'unknown'),
-        )
+        return self._coordinator.sensor_device_info(self._package_id, self._pkg_data)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self._pkg_data = self._coordinator.packages.get(self._package_id, {})
         self.async_on_remove(
-            self._coordinator.async_add_listener(self._handle_coordinator_update)
+            self._coordinator.async_add_package_listener(
+                self._package_id, self._handle_coordinator_update
+            )
         )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # Fetch the package once per update; the properties read this copy.
+        self._pkg_data = self._coordinator.packages.get(self._package_id, {})
         self.async_write_ha_state()
 
     @property
     def native_value(self) -> str:
         """Return the installed version."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
+        package_data = self._pkg_data
         version = package_data.get('installed_version', 'unknown')
         _LOGGER.debug("Version sensor for %s: %s", self._package_id, version)
         return version
@@ -136,7 +135,7 @@ class PackageVersionSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
+        package_data = self._pkg_data
         return {
             ATTR_REPO_NAME: package_data.get('repo_name'),
             ATTR_OWNER: package_data.get('owner'),
@@ -155,6 +154,7 @@ class PackageUpdateSensor(SensorEntity):
         """Initialize the sensor."""
         self._coordinator = coordinator
         self._package_id = package_id
+        self._pkg_data = package_data
         self._entry_id = entry_id
         self._attr_name = f"{package_data['repo_name']} Update Available"
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{package_id}_update"
@@ -163,31 +163,29 @@ class PackageUpdateSensor(SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info - dynamically updated."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._package_id)},
-            name=package_data.get('repo_name', 'Unknown'),
-            manufacturer="OnOff Integration Store",
-            model=package_data.get('package_type', 'unknown').title(),
-            sw_version=package_data.get('installed_version', 'unknown'),
-        )
+        return self._coordinator.sensor_device_info(self._package_id, self._pkg_data)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self._pkg_data = self._coordinator.packages.get(self._package_id, {})
         self.async_on_remove(
-            self._coordinator.async_add_listener(self._handle_coordinator_update)
+            self._coordinator.async_add_package_listener(
+                self._package_id, self._handle_coordinator_update
+            )
         )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # Fetch the package once per update; the properties read this copy.
+        self._pkg_data = self._coordinator.packages.get(self._package_id, {})
         self.async_write_ha_state()
 
     @property
     def native_value(self) -> str:
         """Return Yes/No for update availability."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
+        package_data = self._pkg_data
         update_available = package_data.get('update_available', False)
         result = "Yes" if update_available else "No"
         _LOGGER.debug("Update sensor for %s: %s (installed=%s, latest=%s)",
@@ -199,14 +197,14 @@ class PackageUpdateSensor(SensorEntity):
     @property
     def icon(self) -> str:
         """Return icon based on update status."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
+        package_data = self._pkg_data
         update_available = package_data.get('update_available', False)
         return "mdi:alert-circle" if update_available else "mdi:check-circle"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
+        package_data = self._pkg_data
         return {
             ATTR_INSTALLED_VERSION: package_data.get('installed_version'),
             ATTR_LATEST_VERSION: package_data.get('latest_version', 'unknown'),
@@ -227,6 +225,7 @@ class PackageTypeSensor(SensorEntity):
         """Initialize the sensor."""
         self._coordinator = coordinator
         self._package_id = package_id
+        self._pkg_data = package_data
         self._entry_id = entry_id
         self._attr_name = f"{package_data['repo_name']} Type"
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{package_id}_type"
@@ -235,31 +234,29 @@ class PackageTypeSensor(SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info - dynamically updated."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._package_id)},
-            name=package_data.get('repo_name', 'Unknown'),
-            manufacturer="OnOff Integration Store",
-            model=package_data.get('package_type', 'unknown').title(),
-            sw_version=package_data.get('installed_version', 'unknown'),
-        )
+        return self._coordinator.sensor_device_info(self._package_id, self._pkg_data)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self._pkg_data = self._coordinator.packages.get(self._package_id, {})
         self.async_on_remove(
-            self._coordinator.async_add_listener(self._handle_coordinator_update)
+            self._coordinator.async_add_package_listener(
+                self._package_id, self._handle_coordinator_update
+            )
         )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # Fetch the package once per update; the properties read this copy.
+        self._pkg_data = self._coordinator.packages.get(self._package_id, {})
         self.async_write_ha_state()
 
     @property
     def native_value(self) -> str:
         """Return the package type."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
+        package_data = self._pkg_data
         package_type = package_data.get('package_type', 'unknown')
         # Capitalize properly: integration -> Integration
         return package_type.title()
@@ -267,7 +264,7 @@ class PackageTypeSensor(SensorEntity):
     @property
     def icon(self) -> str:
         """Return icon based on package type."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
+        package_data = self._pkg_data
         package_type = package_data.get('package_type', 'unknown')
 
         icon_map = {
@@ -289,8 +286,11 @@ class WaitingRestartSensor(SensorEntity):
         """Initialize the sensor."""
         self._coordinator = coordinator
         self._package_id = package_id
+        self._pkg_data = package_data
         self._hass = hass
         self._entry_id = entry_id
+        # (raw last_update string, parsed datetime) from the last parse.
+        self._parsed_last_update: tuple[str | None, datetime | None] = (None, None)
         self._attr_name = f"{package_data['repo_name']} Waiting Restart"
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{package_id}_waiting_restart"
         self._attr_icon = "mdi:restart"
@@ -298,31 +298,29 @@ class WaitingRestartSensor(SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info - dynamically updated."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._package_id)},
-            name=package_data.get('repo_name', 'Unknown'),
-            manufacturer="OnOff Integration Store",
-            model=package_data.get('package_type', 'unknown').title(),
-            sw_version=package_data.get('installed_version', 'unknown'),
-        )
+        return self._coordinator.sensor_device_info(self._package_id, self._pkg_data)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self._pkg_data = self._coordinator.packages.get(self._package_id, {})
         self.async_on_remove(
-            self._coordinator.async_add_listener(self._handle_coordinator_update)
+            self._coordinator.async_add_package_listener(
+                self._package_id, self._handle_coordinator_update
+            )
         )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # Fetch the package once per update; the properties read this copy.
+        self._pkg_data = self._coordinator.packages.get(self._package_id, {})
         self.async_write_ha_state()
 
     @property
     def native_value(self) -> str:
         """Return Yes/No based on whether restart is needed."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
+        package_data = self._pkg_data
 
         # Get last_update timestamp (when package was last installed/updated)
         last_update_str = package_data.get('last_update')
@@ -330,8 +328,11 @@ class WaitingRestartSensor(SensorEntity):
             return "No"
 
         try:
-            # Parse last_update timestamp
-            last_update = datetime.fromisoformat(last_update_str)
+            # Parse last_update timestamp, only when it changed
+            cached_str, last_update = self._parsed_last_update
+            if last_update_str != cached_str:
+                last_update = datetime.fromisoformat(last_update_str)
+                self._parsed_last_update = (last_update_str, last_update)
 
             # Get HA start time
             ha_start_time = self._hass.data.get('homeassistant_start_time')
@@ -363,7 +364,7 @@ class WaitingRestartSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        package_data = self._coordinator.packages.get(self._package_id, {})
+        package_data = self._pkg_data
         return {
             'last_update': package_data.get('last_update'),
             'installed_version': package_data.get('installed_version'),
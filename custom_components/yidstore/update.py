@@ -1,9 +1,12 @@
 """Update entities for OnOff Integration Store."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
+import aiohttp
+
 from homeassistant.components.update import (
     UpdateEntity,
     UpdateEntityFeature,
@@ -12,12 +15,27 @@ from homeassistant.components.update import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 
 from .const import DOMAIN, SERVICE_INSTALL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Package fields the entity's state and attributes are derived from.
+_STATE_FIELDS = (
+    "installed_version",
+    "latest_version",
+    "update_available",
+    "release_summary",
+    "repo_name",
+    "package_type",
+    "domain",
+    "source",
+)
+
+_NO_RELEASE_NOTES = "No release notes available."
+
+_FEATURES_WITH_NOTES = UpdateEntityFeature.INSTALL | UpdateEntityFeature.RELEASE_NOTES
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -28,25 +46,39 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
     # Create update entities for all tracked packages
-    entities = []
-    for package_id, package_data in coordinator.packages.items():
-        entities.append(PackageUpdateEntity(coordinator, package_id, package_data, entry))
-
-    async_add_entities(entities)
+    packages = coordinator.packages
+    async_add_entities(
+        PackageUpdateEntity(coordinator, package_id, package_data, entry)
+        for package_id, package_data in packages.items()
+    )
 
-    # Store callback for dynamic entity creation
+    # Store callback for dynamic entity creation, dropped again on unload
     coordinator._add_update_entities_callback = async_add_entities
 
+    @callback
+    def _clear_add_entities_callback() -> None:
+        coordinator._add_update_entities_callback = None
+
+    entry.async_on_unload(_clear_add_entities_callback)
+
 
 class PackageUpdateEntity(UpdateEntity):
     """Update entity for a tracked package."""
 
+    # HA's Entity base keeps a __dict__ (cached properties, _attr_ storage),
+    # so only this class's own fields can live in slots.
+    __slots__ = (
+        "coordinator",
+        "package_id",
+        "_entry",
+        "_last_seen",
+        "_last_identity",
+        "_install_call",
+    )
+
     _attr_has_entity_name = True
     _attr_device_class = UpdateDeviceClass.FIRMWARE
-    _attr_supported_features = (
-        UpdateEntityFeature.INSTALL
-        | UpdateEntityFeature.RELEASE_NOTES
-    )
+    _attr_supported_features = _FEATURES_WITH_NOTES
 
     def __init__(
         self,
@@ -58,62 +90,45 @@ class PackageUpdateEntity(UpdateEntity):
         """Initialize the update entity."""
         self.coordinator = coordinator
         self.package_id = package_id
-        self._package_data = package_data
         self._entry = entry
+        self._last_seen: tuple | None = None
+        self._last_identity: tuple | None = None
         self._attr_unique_id = f"{package_id}_update"
         self._attr_name = "Update"
-
-        # Set device info
-        repo_name = package_data.get("repo_name", package_id)
-        owner = package_data.get("owner", "Unknown")
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, package_id)},
-            name=self._format_name(repo_name),
-            manufacturer=owner,
-            model=package_data.get("package_type", "integration").title(),
-            sw_version=package_data.get("installed_version"),
+        self._update_from_package(package_data)
+        self._attr_device_info = coordinator.update_device_info(
+            package_id, package_data, self._attr_title
         )
 
-    def _format_name(self, name: str) -> str:
-        """Format repo name for display."""
-        s = name[2:] if name.startswith('x-') else name
-        s = s.replace('_', ' ').replace('-', ' ')
-        return ' '.join(word.capitalize() for word in s.split())
-
-    @property
-    def installed_version(self) -> str | None:
-        """Return the installed version."""
-        pkg = self.coordinator.packages.get(self.package_id, {})
-        return pkg.get("installed_version")
-
-    @property
-    def latest_version(self) -> str | None:
-        """Return the latest version.
-
-        HA's update entity flags an update whenever this string differs
-        from installed_version, so follow the coordinator's (normalized)
-        decision — otherwise "v3.2.0" vs "3.2.0" shows a phantom update.
-        """
-        pkg = self.coordinator.packages.get(self.package_id, {})
-        if not pkg.get("update_available"):
-            return pkg.get("installed_version")
-        return pkg.get("latest_version")
-
-    @property
-    def release_summary(self) -> str | None:
-        """Return the release summary."""
-        pkg = self.coordinator.packages.get(self.package_id, {})
-        return pkg.get("release_summary")
-
-    @property
-    def title(self) -> str | None:
-        """Return the title of the update."""
-        pkg = self.coordinator.packages.get(self.package_id, {})
+    def _update_from_package(self, pkg: dict[str, Any]) -> None:
+        """Derive the cached attributes from the package data."""
         repo_name = pkg.get("repo_name", self.package_id)
-        return self._format_name(repo_name)
-
-    @property
-    def entity_picture(self) -> str | None:
+        # Name and picture only change if the repo is renamed or retyped.
+        identity = (repo_name, pkg.get("package_type"), pkg.get("domain"))
+        if identity != self._last_identity:
+            self._last_identity = identity
+            self._attr_title = self._format_name(repo_name)
+            self._attr_entity_picture = self._brand_icon_url(pkg)
+        self._attr_installed_version = pkg.get("installed_version")
+        # HA's update entity flags an update whenever latest_version differs
+        # from installed_version, so follow the coordinator's (normalized)
+        # decision — otherwise "v3.2.0" vs "3.2.0" shows a phantom update.
+        self._attr_latest_version = (
+            pkg.get("latest_version")
+            if pkg.get("update_available")
+            else self._attr_installed_version
+        )
+        self._attr_release_summary = pkg.get("release_summary")
+        # Release notes of GitHub-sourced repos are neither stored by the
+        # update check nor fetchable through the store's client; don't have
+        # the update dialog ask for them on every open.
+        if pkg.get("release_notes") or pkg.get("source") != "github":
+            self._attr_supported_features = _FEATURES_WITH_NOTES
+        else:
+            self._attr_supported_features = UpdateEntityFeature.INSTALL
+
+    @staticmethod
+    def _brand_icon_url(pkg: dict[str, Any]) -> str | None:
         """Return the installed integration's own brand icon.
 
         Served by YidStore's brands endpoint, which prefers the icon
@@ -121,7 +136,6 @@ class PackageUpdateEntity(UpdateEntity):
         the official HA brands site — so update entities show the
         integration's icon instead of YidStore's.
         """
-        pkg = self.coordinator.packages.get(self.package_id, {})
         if pkg.get("package_type", "integration") != "integration":
             return None
         domain = pkg.get("domain") or pkg.get("repo_name", "").lower().replace("-", "_")
@@ -129,26 +143,45 @@ class PackageUpdateEntity(UpdateEntity):
             return None
         return f"/api/yidstore/brands/{domain}/icon.png"
 
+    @staticmethod
+    def _state_key(pkg: dict[str, Any]) -> tuple:
+        return tuple(pkg.get(field) for field in _STATE_FIELDS)
+
+    @staticmethod
+    def _format_name(name: str) -> str:
+        """Format repo name for display."""
+        if not name:
+            return name
+        s = name[2:] if name.startswith('x-') else name
+        s = s.replace('_', ' ').replace('-', ' ')
+        # Not str.title(): that would also capitalize after digits
+        # ("zigbee2mqtt" -> "Zigbee2Mqtt") and keep doubled separators.
+        return ' '.join([word.capitalize() for word in s.split()])
+
     async def async_release_notes(self) -> str | None:
         """Return the release notes."""
         pkg = self.coordinator.packages.get(self.package_id, {})
-        notes = pkg.get("release_notes")
-
-        if notes:
-            return notes
+        # The update check stores the latest release's body (possibly
+        # empty); once it has, that's the answer — don't fetch it again.
+        if "release_notes" in pkg:
+            return pkg["release_notes"] or _NO_RELEASE_NOTES
 
         # Try to fetch release notes from the latest release
-        try:
-            owner = pkg.get("owner")
-            repo = pkg.get("repo_name")
-            if owner and repo:
-                release = await self.coordinator.client.get_latest_release(owner, repo)
-                if release:
-                    return release.get("body", "No release notes available.")
-        except Exception as e:
-            _LOGGER.debug("Failed to fetch release notes: %s", e)
-
-        return "No release notes available."
+        owner = pkg.get("owner")
+        repo = pkg.get("repo_name")
+        if owner and repo:
+            try:
+                notes = await self.coordinator.async_get_release_notes(owner, repo)
+                if notes:
+                    return notes
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # Network hiccups and rate limits are routine here; just
+                # fall back to the placeholder.
+                pass
+            except Exception as e:
+                _LOGGER.debug("Failed to fetch release notes: %s", e)
+
+        return _NO_RELEASE_NOTES
 
     async def async_install(
         self, version: str | None, backup: bool, **kwargs: Any
@@ -167,46 +200,66 @@ class PackageUpdateEntity(UpdateEntity):
             _LOGGER.error("Cannot install update: missing owner or repo")
             return
 
-        _LOGGER.info("Installing update for %s/%s to version %s", owner, repo, version or "latest")
+        # The install service logs the details itself.
+        _LOGGER.debug("Installing update for %s/%s to version %s", owner, repo, version or "latest")
 
-        # Build service data
-        service_data = {
-            "owner": owner,
-            "repo": repo,
-            "type": pkg_type,
-        }
+        # Build service data, leaving out the optional fields that are unset.
         # Carry the source so GitHub-installed repos update via GitHub, not the
         # Gitea store (otherwise the latest-release lookup hits the wrong server
         # and 404s — and would leak the store URL in the error).
-        if source:
-            service_data["source"] = source
-        if repo_url:
-            service_data["repo_url"] = repo_url
-        if mode:
-            service_data["mode"] = mode
-        if asset_name:
-            service_data["asset_name"] = asset_name
-        if version:
-            service_data["tag"] = version
-
-        # Call the install service
-        await self.hass.services.async_call(
+        service_data = {
+            key: value
+            for key, value in (
+                ("owner", owner),
+                ("repo", repo),
+                ("type", pkg_type),
+                ("source", source),
+                ("repo_url", repo_url),
+                ("mode", mode),
+                ("asset_name", asset_name),
+                ("tag", version),
+            )
+            if value
+        }
+
+        # Call the install service; blocking, so the entity shows the install
+        # in progress and a failure reaches the caller.
+        await self._install_call(
             DOMAIN,
             SERVICE_INSTALL,
             service_data,
             blocking=True,
         )
 
-        _LOGGER.info("Update installed for %s", repo)
+        _LOGGER.debug("Update installed for %s", repo)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        pkg = self.coordinator.packages.get(self.package_id)
+        # A removed package keeps its last state until the entity goes away.
+        if pkg is None:
+            return
+        # Most coordinator ticks (e.g. another package's update check) leave
+        # this package untouched; don't rewrite an identical state.
+        state_key = self._state_key(pkg)
+        if state_key == self._last_seen:
+            return
+        self._last_seen = state_key
+        self._update_from_package(pkg)
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self._install_call = self.hass.services.async_call
+        pkg = self.coordinator.packages.get(self.package_id)
+        if pkg is not None:
+            self._last_seen = self._state_key(pkg)
+            self._update_from_package(pkg)
+        # Only wake up for changes to this entity's own package.
         self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
+            self.coordinator.async_add_package_listener(
+                self.package_id, self._handle_coordinator_update
+            )
         )